@@ -1,6 +1,9 @@
 """Example usage of pysaunum library."""
 
 import asyncio
+import importlib
+import os
+from collections.abc import Callable
 
 from pysaunum import (
     SaunumClient,
@@ -23,44 +26,64 @@ from pysaunum.const import (
 
 HOST = "192.168.1.143"
 
+# Pause between demo steps in seconds; set PYSAUNUM_DEMO_DELAY=0 for smoke runs
+DEMO_DELAY = float(os.environ.get("PYSAUNUM_DEMO_DELAY", "2"))
+
+# Display names for enum values, built once instead of on every print
+_FAN_NAMES: dict[FanSpeed | None, str] = {
+    speed: speed.name.capitalize() for speed in FanSpeed
+}
+_SAUNA_TYPE_NAMES: dict[SaunaType | int, str] = {
+    sauna_type: sauna_type.name for sauna_type in SaunaType
+}
+
+# Alarm labels and the SaunumData attributes they are read from
+_ALARM_FIELDS = (
+    ("Door open", "alarm_door_open"),
+    ("Door sensor", "alarm_door_sensor"),
+    ("Thermal cutoff", "alarm_thermal_cutoff"),
+    ("Internal temp", "alarm_internal_temp"),
+    ("Temp sensor short", "alarm_temp_sensor_short"),
+    ("Temp sensor open", "alarm_temp_sensor_open"),
+)
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory when it is installed."""
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
 
 def _print_state(data: SaunumData) -> None:
     """Print the full sauna state."""
-    fan_name = (
-        data.fan_speed.name.capitalize() if data.fan_speed is not None else "Unknown"
-    )
+    fan_name = _FAN_NAMES.get(data.fan_speed, "Unknown")
     sauna_type_name = (
-        data.sauna_type.name
-        if isinstance(data.sauna_type, SaunaType)
-        else f"Unknown({data.sauna_type})"
+        _SAUNA_TYPE_NAMES.get(data.sauna_type) or f"Unknown({data.sauna_type})"
     )
 
-    print(f"  Current temperature: {data.current_temperature}°C")
-    print(f"  Target temperature:  {data.target_temperature}°C")
-    print(f"  Session active:      {data.session_active}")
-    print(f"  Heater elements:     {data.heater_elements_active}")
-    print(f"  Fan speed:           {data.fan_speed} ({fan_name})")
-    print(f"  Sauna type:          {data.sauna_type} ({sauna_type_name})")
-    print(f"  Session duration:    {data.sauna_duration} minutes")
-    print(f"  Fan duration:        {data.fan_duration} minutes")
-    print(f"  Light on:            {data.light_on}")
-    print(f"  Door open:           {data.door_open}")
-    print(f"  On time:             {data.on_time} seconds")
-
-    # Alarm summary
-    alarms = [
-        ("Door open", data.alarm_door_open),
-        ("Door sensor", data.alarm_door_sensor),
-        ("Thermal cutoff", data.alarm_thermal_cutoff),
-        ("Internal temp", data.alarm_internal_temp),
-        ("Temp sensor short", data.alarm_temp_sensor_short),
-        ("Temp sensor open", data.alarm_temp_sensor_open),
-    ]
-    active_alarms = [name for name, active in alarms if active]
-    if active_alarms:
-        print(f"  Active alarms:       {', '.join(active_alarms)}")
-    else:
-        print("  Active alarms:       None")
+    active_alarms = ", ".join(
+        label for label, attr in _ALARM_FIELDS if getattr(data, attr)
+    )
+
+    # Emit the whole block with one write instead of one per line
+    print(
+        f"  Current temperature: {data.current_temperature}°C\n"
+        f"  Target temperature:  {data.target_temperature}°C\n"
+        f"  Session active:      {data.session_active}\n"
+        f"  Heater elements:     {data.heater_elements_active}\n"
+        f"  Fan speed:           {data.fan_speed} ({fan_name})\n"
+        f"  Sauna type:          {data.sauna_type} ({sauna_type_name})\n"
+        f"  Session duration:    {data.sauna_duration} minutes\n"
+        f"  Fan duration:        {data.fan_duration} minutes\n"
+        f"  Light on:            {data.light_on}\n"
+        f"  Door open:           {data.door_open}\n"
+        f"  On time:             {data.on_time} seconds\n"
+        f"  Active alarms:       {active_alarms or 'None'}"
+    )
 
 
 async def main() -> None:
@@ -79,31 +102,28 @@ async def main() -> None:
         # Example: Configure sauna settings
         print("\nConfiguring sauna settings...")
 
-        # Set sauna type (0=Type 1, 1=Type 2, 2=Type 3)
-        print(f"Setting sauna type to Type 2 (value {SaunaType.TYPE_2})...")
-        await client.async_set_sauna_type(SaunaType.TYPE_2)
-
-        # Set target temperature (0 for type default, or 40-100°C)
-        print("Setting target temperature to 85°C...")
-        await client.async_set_target_temperature(85)
-
-        # Set session duration (0-720 minutes, 0 for type default)
-        print(f"Setting session duration to {DEFAULT_DURATION} minutes...")
-        await client.async_set_sauna_duration(DEFAULT_DURATION)
-
-        # Set fan speed (0=Off, 1=Low, 2=Medium, 3=High)
-        print(f"Setting fan speed to Medium ({FanSpeed.MEDIUM})...")
-        await client.async_set_fan_speed(FanSpeed.MEDIUM)
-
-        # Set fan duration (0-30 minutes, 0 for type default)
-        print("Setting fan duration to 15 minutes...")
-        await client.async_set_fan_duration(15)
-
-        # Start a sauna session
-        print("\nStarting sauna session...")
-        await client.async_start_session()
-
-        await asyncio.sleep(2)
+        # These settings live in adjacent registers, so they are written
+        # in a single request, followed by starting the session:
+        # - sauna type Type 2 (0=Type 1, 1=Type 2, 2=Type 3)
+        # - target temperature 85°C (0 for type default, or 40-100°C)
+        # - session duration (0-720 minutes, 0 for type default)
+        # - fan speed Medium (0=Off, 1=Low, 2=Medium, 3=High)
+        # - fan duration 15 minutes (0-30 minutes, 0 for type default)
+        print(
+            f"Setting sauna type {SaunaType.TYPE_2}, target 85°C, "
+            f"duration {DEFAULT_DURATION} minutes, fan Medium ({FanSpeed.MEDIUM}) "
+            "for 15 minutes and starting the session..."
+        )
+        await client.async_apply_settings(
+            sauna_type=SaunaType.TYPE_2,
+            target_temperature=85,
+            sauna_duration=DEFAULT_DURATION,
+            fan_speed=FanSpeed.MEDIUM,
+            fan_duration=15,
+            session_active=True,
+        )
+
+        await asyncio.sleep(DEMO_DELAY)
 
         # Read updated state
         print("\nReading updated state after configuration...")
@@ -115,19 +135,19 @@ async def main() -> None:
         for speed in (FanSpeed.OFF, FanSpeed.LOW, FanSpeed.HIGH, FanSpeed.OFF):
             print(f"Setting fan to {speed.name.capitalize()}...")
             await client.async_set_fan_speed(speed)
-            await asyncio.sleep(2)
+            await asyncio.sleep(DEMO_DELAY)
 
         # Stop the session
         print("\nStopping session...")
         await client.async_stop_session()
 
-        await asyncio.sleep(2)
+        await asyncio.sleep(DEMO_DELAY)
 
         # Demonstrate light control
         print("\nTesting light control...")
         await client.async_set_light_control(True)
         print("Light turned on")
-        await asyncio.sleep(2)
+        await asyncio.sleep(DEMO_DELAY)
         await client.async_set_light_control(False)
         print("Light turned off")
 
@@ -168,7 +188,7 @@ async def main_with_context_manager() -> None:
                 await client.async_start_session()
                 print("Session started!")
 
-                await asyncio.sleep(2)
+                await asyncio.sleep(DEMO_DELAY)
 
                 # Stop the session before exiting
                 print("Stopping session...")
@@ -211,19 +231,25 @@ async def demonstrate_constants() -> None:
     print(f"  MAX_FAN_DURATION = {MAX_FAN_DURATION} minutes")
 
 
-if __name__ == "__main__":
-    print("PYSAUNUM LIBRARY EXAMPLE")
-    print("=" * 50)
-
+async def run_all() -> None:
+    """Run every demonstration in sequence on one event loop."""
     # Show available constants
-    asyncio.run(demonstrate_constants())
+    await demonstrate_constants()
 
     # Run the full example
     print("\nFULL FEATURE DEMONSTRATION")
     print("=" * 50)
-    asyncio.run(main())
+    await main()
 
     # Run context manager example
-    asyncio.run(main_with_context_manager())
+    await main_with_context_manager()
+
+
+if __name__ == "__main__":
+    print("PYSAUNUM LIBRARY EXAMPLE")
+    print("=" * 50)
+
+    # Use uvloop when available
+    asyncio.run(run_all(), loop_factory=_loop_factory())
 
     print("\nExample completed!")
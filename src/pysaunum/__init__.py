@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 from .client import SaunumClient
 from .const import (
@@ -21,6 +21,7 @@ from .const import (
     MIN_FAN_DURATION,
     MIN_FAN_SPEED,
     MIN_TEMPERATURE,
+    AlarmFlag,
     FanSpeed,
     SaunaType,
 )
@@ -33,8 +34,6 @@ from .exceptions import (
 )
 from .models import SaunumData
 
-__version__ = version("pysaunum")
-
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = [
@@ -59,6 +58,22 @@ __all__ = [
     "MAX_FAN_DURATION",
     "MIN_FAN_SPEED",
     "MAX_FAN_SPEED",
+    "AlarmFlag",
     "FanSpeed",
     "SaunaType",
 ]
+
+
+if TYPE_CHECKING:
+    __version__: str
+else:
+
+    def __getattr__(name: str) -> str:
+        """Resolve __version__ from package metadata on first access."""
+        if name == "__version__":
+            from importlib.metadata import version
+
+            value = version("pysaunum")
+            globals()["__version__"] = value
+            return value
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Self, cast
+import socket
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from functools import partial
+from typing import Any, ClassVar, Self
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException
+from pymodbus.pdu import ModbusPDU
 
 from .const import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CONTROL_CACHE_TTL,
     DEFAULT_DEVICE_ID,
     DEFAULT_PORT,
+    DEFAULT_RETRIES,
     DEFAULT_TIMEOUT,
+    DEFAULT_UPDATE_INTERVAL,
+    FAN_SPEED_VALUES,
+    MAX_ALARM_POLL_STRIDE,
     MAX_DURATION,
     MAX_FAN_DURATION,
     MAX_TEMPERATURE,
     MIN_DURATION,
     MIN_FAN_DURATION,
     MIN_TEMPERATURE,
+    RECONNECT_DELAYS,
     REG_ALARM_DOOR_OPEN,
     REG_CURRENT_TEMP,
     REG_FAN_DURATION,
@@ -27,6 +39,8 @@ from .const import (
     REG_SAUNA_TYPE,
     REG_SESSION_ACTIVE,
     REG_TARGET_TEMPERATURE,
+    RETRY_BACKOFF,
+    SAUNA_TYPE_VALUES,
     STATUS_OFF,
     STATUS_ON,
     FanSpeed,
@@ -35,6 +49,7 @@ from .const import (
 from .exceptions import (
     SaunumCommunicationError,
     SaunumConnectionError,
+    SaunumException,
     SaunumInvalidDataError,
     SaunumTimeoutError,
 )
@@ -44,13 +59,123 @@ __all__ = ["SaunumClient"]
 
 _LOGGER = logging.getLogger(__name__)
 
-_UINT16_MAX = 0x10000
-_INT16_SIGN_BIT = 0x8000
+# Register blocks read by async_get_data as (name, address, count)
+_READ_BLOCKS: tuple[tuple[str, int, int], ...] = (
+    ("control", REG_SESSION_ACTIVE, 7),
+    ("status", REG_CURRENT_TEMP, 5),
+    ("alarm", REG_ALARM_DOOR_OPEN, 6),
+)
+# Alarm registers reported while adaptive polling skips reading them
+_QUIET_ALARMS = (0,) * _READ_BLOCKS[2][2]
+# Most holding registers a single Modbus read may request
+_MAX_READ_COUNT = 125
+
+# Accepted setter values; membership tests on these run in C
+_VALID_TEMPERATURES = frozenset({0, *range(MIN_TEMPERATURE, MAX_TEMPERATURE + 1)})
+_VALID_DURATIONS = range(MIN_DURATION, MAX_DURATION + 1)
+_VALID_FAN_DURATIONS = range(MIN_FAN_DURATION, MAX_FAN_DURATION + 1)
+
+# Registers the controller changes on its own, such as a session ending when
+# its duration runs out; skip_unchanged_writes always writes these
+_DEVICE_CHANGED_REGISTERS = frozenset({REG_SESSION_ACTIVE, REG_LIGHT_CONTROL})
+
+# Enum members by raw register value, so parsing skips the enum constructor
+_FAN_SPEEDS: dict[int, FanSpeed] = {speed.value: speed for speed in FanSpeed}
+_SAUNA_TYPES: dict[int, SaunaType] = {
+    sauna_type.value: sauna_type for sauna_type in SaunaType
+}
+
+# TCP keepalive probing so idle connections survive NAT and firewall timeouts:
+# first probe after 30 s idle, then every 10 s, dropping after 3 misses
+_KEEPALIVE_OPTIONS = tuple(
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (
+        ("TCP_KEEPIDLE", 30),
+        ("TCP_KEEPINTVL", 10),
+        ("TCP_KEEPCNT", 3),
+    )
+    if hasattr(socket, name)
+)
+
+# Pooled connections are keyed by event loop as well as host and port, since
+# a connection and its lock only work on the loop they were made on
+_PoolKey = tuple[asyncio.AbstractEventLoop, str, int]
 
 
 def _decode_int16(value: int) -> int:
     """Decode an unsigned 16-bit Modbus register as a signed integer."""
-    return value - _UINT16_MAX if value >= _INT16_SIGN_BIT else value
+    # Flipping the sign bit and subtracting it sign-extends without a branch
+    return (value ^ 0x8000) - 0x8000
+
+
+def _plan_reads(
+    blocks: tuple[tuple[str, int, int], ...], merge_gaps: bool
+) -> list[tuple[int, int, list[tuple[str, int, int]]]]:
+    """Group register blocks into as few reads as the request size allows.
+
+    Adjacent blocks are always read together. With merge_gaps, blocks
+    separated by unused registers are also combined while the read stays
+    within the Modbus limit of 125 registers.
+
+    Returns:
+        Reads as (address, count, blocks), in address order
+    """
+    reads: list[tuple[int, int, list[tuple[str, int, int]]]] = []
+    for block in sorted(blocks, key=lambda block: block[1]):
+        _, address, count = block
+        if reads:
+            start, read_count, members = reads[-1]
+            end = address + count
+            if (merge_gaps or address == start + read_count) and (
+                end - start <= _MAX_READ_COUNT
+            ):
+                reads[-1] = (start, end - start, [*members, block])
+                continue
+        reads.append((address, count, [block]))
+    return reads
+
+
+def _check_target_temperature(temperature: int) -> None:
+    """Raise ValueError if a target temperature is out of range."""
+    if temperature not in _VALID_TEMPERATURES:
+        raise ValueError(
+            f"Temperature {temperature}°C out of range "
+            f"(0=type defined, {MIN_TEMPERATURE}-{MAX_TEMPERATURE}°C)"
+        )
+
+
+def _check_sauna_duration(minutes: int) -> None:
+    """Raise ValueError if a session duration is out of range."""
+    if minutes not in _VALID_DURATIONS:
+        raise ValueError(
+            f"Duration {minutes} minutes out of range ({MIN_DURATION}-{MAX_DURATION})"
+        )
+
+
+def _check_fan_duration(minutes: int) -> None:
+    """Raise ValueError if a fan duration is out of range."""
+    if minutes not in _VALID_FAN_DURATIONS:
+        raise ValueError(
+            f"Fan duration {minutes} minutes out of range "
+            f"({MIN_FAN_DURATION}-{MAX_FAN_DURATION})"
+        )
+
+
+def _check_fan_speed(speed: int) -> None:
+    """Raise ValueError if a fan speed is not a FanSpeed value."""
+    if speed not in FAN_SPEED_VALUES:
+        raise ValueError(
+            f"Fan speed {speed} out of range ({FanSpeed.OFF}-{FanSpeed.HIGH})"
+        )
+
+
+def _check_sauna_type(sauna_type: int) -> None:
+    """Raise ValueError if a sauna type is not a SaunaType value."""
+    if sauna_type not in SAUNA_TYPE_VALUES:
+        raise ValueError(
+            f"Sauna type {sauna_type} invalid. "
+            f"Use {SaunaType.TYPE_1}, {SaunaType.TYPE_2}, or {SaunaType.TYPE_3}"
+        )
 
 
 def _validate_registers(name: str, result: Any, expected_count: int) -> list[int]:
@@ -58,26 +183,41 @@ def _validate_registers(name: str, result: Any, expected_count: int) -> list[int
     if result.isError():
         raise SaunumCommunicationError(f"Failed to read {name} registers: {result}")
 
-    registers = getattr(result, "registers", None)
-    if registers is None or len(registers) < expected_count:
-        actual_count = 0 if registers is None else len(registers)
+    registers: list[int] | None
+    try:
+        registers = result.registers
+    except AttributeError:
+        registers = None
+    if not registers or len(registers) < expected_count:
         raise SaunumInvalidDataError(
             f"Incomplete {name} register data: "
-            f"expected {expected_count}, got {actual_count}"
+            f"expected {expected_count}, got {len(registers or ())}"
         )
 
-    return cast(list[int], registers)
+    return registers
 
 
 class SaunumClient:
     """Client for Saunum sauna controller."""
 
+    # Connections shared by clients created with pooled=True
+    _pool: ClassVar[dict[_PoolKey, AsyncModbusTcpClient]] = {}
+    _pool_locks: ClassVar[dict[_PoolKey, asyncio.Lock]] = {}
+
     def __init__(
         self,
         host: str,
         port: int = DEFAULT_PORT,
         device_id: int = DEFAULT_DEVICE_ID,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        retries: int = DEFAULT_RETRIES,
+        batch_reads: bool = False,
+        auto_reconnect: bool = False,
+        control_cache_ttl: float = DEFAULT_CONTROL_CACHE_TTL,
+        skip_unchanged_writes: bool = False,
+        pooled: bool = False,
+        adaptive_alarm_polling: bool = False,
     ) -> None:
         """Initialize the Saunum client.
 
@@ -85,27 +225,130 @@ class SaunumClient:
             host: IP address or hostname of the sauna controller
             port: Modbus TCP port (default: 502)
             device_id: Modbus device/unit ID (default: 1)
-            timeout: Connection timeout in seconds (default: 10)
+            timeout: Connection and per-request timeout in seconds (default: 10)
+            cache_ttl: Seconds to reuse data read by async_get_data
+                (default: 0, always read from the controller)
+            retries: Times to retry a request after a Modbus error or a
+                response that did not arrive within timeout (default: 2)
+            batch_reads: Combine register blocks that fit in one request,
+                reading the unused registers between them (default: False)
+            auto_reconnect: Reconnect and retry a request once when the
+                connection has dropped instead of raising
+                SaunumConnectionError (default: False)
+            control_cache_ttl: Seconds to reuse the control registers
+                between reads; writes through the client refresh them
+                (default: 0, always read them)
+            skip_unchanged_writes: Skip writing a setting that the controller
+                was last seen to hold, either read by async_get_data or
+                written by this client (default: False)
+            pooled: Share one connection with other pooled clients for the
+                same host and port on the same event loop, left open by
+                async_close so the next client skips the TCP handshake;
+                the first client's timeout applies to the shared
+                connection (default: False)
+            adaptive_alarm_polling: Read the alarm registers less often
+                while no alarm is active, doubling the gap up to every 8th
+                read; an alarm raised in between is reported late
+                (default: False)
 
         Note:
             For production use, prefer using the create() factory method
             which ensures the connection is established before returning.
 
         Raises:
-            ValueError: If host is empty or blank
+            ValueError: If host is empty or blank, or cache_ttl, retries or
+                control_cache_ttl is negative
         """
         if not host or not host.strip():
             raise ValueError("Host must be a non-empty string")
+        if cache_ttl < 0:
+            raise ValueError(f"Cache TTL {cache_ttl} must not be negative")
+        if retries < 0:
+            raise ValueError(f"Retries {retries} must not be negative")
+        if control_cache_ttl < 0:
+            raise ValueError(
+                f"Control cache TTL {control_cache_ttl} must not be negative"
+            )
 
         self._host = host
         self._port = port
         self._device_id = device_id
         self._timeout = timeout
-        self._client = AsyncModbusTcpClient(
-            host=host,
-            port=port,
-            timeout=timeout,
-        )
+        self._cache_ttl = cache_ttl
+        self._retries = retries
+        # Read plans by whether the control and alarm blocks are read
+        control, status, alarm = _READ_BLOCKS
+        self._read_plans = {
+            (True, True): _plan_reads(_READ_BLOCKS, merge_gaps=batch_reads),
+            (False, True): _plan_reads((status, alarm), merge_gaps=batch_reads),
+            (True, False): _plan_reads((control, status), merge_gaps=batch_reads),
+            (False, False): _plan_reads((status,), merge_gaps=batch_reads),
+        }
+        self._control_cache_ttl = control_cache_ttl
+        self._control_cache: list[int] | None = None
+        self._control_cache_expiry = 0.0
+        self._skip_unchanged_writes = skip_unchanged_writes
+        self._known_values: dict[int, int] = {}
+        self._adaptive_alarm_polling = adaptive_alarm_polling
+        self._alarm_poll_stride = 1
+        self._alarm_polls_skipped = 0
+        self._auto_reconnect = auto_reconnect
+        self._reconnect_lock = asyncio.Lock()
+        self._pending_writes: set[asyncio.Task[None]] = set()
+        # Last write queued per register, so later writes wait for its retries
+        self._queued_writes: dict[int, asyncio.Task[None]] = {}
+        self._cache_value: SaunumData | None = None
+        self._cache_expiry = 0.0
+        self._data_task: asyncio.Task[SaunumData] | None = None
+        self._pooled = pooled
+        self._connect_lock = asyncio.Lock()
+        client = self._pool.get(self._pool_key()) if pooled else None
+        if client is None:
+            # pymodbus times each attempt; retries are left to
+            # _async_request so they are not multiplied by a second layer
+            client = AsyncModbusTcpClient(
+                host=host,
+                port=port,
+                timeout=timeout,
+                retries=0,
+            )
+        self._bind_client(client)
+        if pooled:
+            self._join_pool()
+
+    def _bind_client(self, client: AsyncModbusTcpClient) -> None:
+        """Use a Modbus client for all requests."""
+        self._client = client
+        # Bind the device ID once instead of passing it on every request
+        device_id = self._device_id
+        self._read = partial(client.read_holding_registers, device_id=device_id)
+        self._write = partial(client.write_register, device_id=device_id)
+        self._write_multiple = partial(client.write_registers, device_id=device_id)
+
+    @classmethod
+    def _drop_closed_loops(cls) -> None:
+        """Forget pooled connections made on event loops that have closed."""
+        for key in [key for key in cls._pool if key[0].is_closed()]:
+            del cls._pool[key]
+            cls._pool_locks.pop(key, None)
+
+    def _pool_key(self) -> _PoolKey:
+        """Return the pool key for this host and port on the running loop."""
+        self._drop_closed_loops()
+        return asyncio.get_running_loop(), self._host, self._port
+
+    def _join_pool(self) -> None:
+        """Share the pooled connection for this host, port and event loop.
+
+        This client's connection is added to the pool when the pool has
+        none, for example after async_close_pool, so it is closed with it.
+        """
+        key = self._pool_key()
+        client = self._pool.setdefault(key, self._client)
+        if client is not self._client:
+            self._bind_client(client)
+        # Pooled clients share a lock so only one of them opens the connection
+        self._connect_lock = self._pool_locks.setdefault(key, self._connect_lock)
 
     @classmethod
     async def create(
@@ -114,6 +357,14 @@ class SaunumClient:
         port: int = DEFAULT_PORT,
         device_id: int = DEFAULT_DEVICE_ID,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        retries: int = DEFAULT_RETRIES,
+        batch_reads: bool = False,
+        auto_reconnect: bool = False,
+        control_cache_ttl: float = DEFAULT_CONTROL_CACHE_TTL,
+        skip_unchanged_writes: bool = False,
+        pooled: bool = False,
+        adaptive_alarm_polling: bool = False,
     ) -> SaunumClient:
         """Create and connect a SaunumClient instance.
 
@@ -121,11 +372,38 @@ class SaunumClient:
         before returning. This is the recommended way to create clients
         for production use.
 
+        When cache_ttl is set, the current data is read once before
+        returning so the first async_get_data call can be served from cache.
+
         Args:
             host: IP address or hostname of the sauna controller
             port: Modbus TCP port (default: 502)
             device_id: Modbus device/unit ID (default: 1)
-            timeout: Connection timeout in seconds (default: 10)
+            timeout: Connection and per-request timeout in seconds (default: 10)
+            cache_ttl: Seconds to reuse data read by async_get_data
+                (default: 0, always read from the controller)
+            retries: Times to retry a request after a Modbus error or a
+                response that did not arrive within timeout (default: 2)
+            batch_reads: Combine register blocks that fit in one request,
+                reading the unused registers between them (default: False)
+            auto_reconnect: Reconnect and retry a request once when the
+                connection has dropped instead of raising
+                SaunumConnectionError (default: False)
+            control_cache_ttl: Seconds to reuse the control registers
+                between reads; writes through the client refresh them
+                (default: 0, always read them)
+            skip_unchanged_writes: Skip writing a setting that the controller
+                was last seen to hold, either read by async_get_data or
+                written by this client (default: False)
+            pooled: Share one connection with other pooled clients for the
+                same host and port on the same event loop, left open by
+                async_close so the next client skips the TCP handshake;
+                the first client's timeout applies to the shared
+                connection (default: False)
+            adaptive_alarm_polling: Read the alarm registers less often
+                while no alarm is active, doubling the gap up to every 8th
+                read; an alarm raised in between is reported late
+                (default: False)
 
         Returns:
             Connected SaunumClient instance
@@ -140,9 +418,30 @@ class SaunumClient:
             >>> data = await client.async_get_data()
         """
         _LOGGER.debug("Creating client for %s:%s", host, port)
-        client = cls(host=host, port=port, device_id=device_id, timeout=timeout)
+        client = cls(
+            host=host,
+            port=port,
+            device_id=device_id,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            retries=retries,
+            batch_reads=batch_reads,
+            auto_reconnect=auto_reconnect,
+            control_cache_ttl=control_cache_ttl,
+            skip_unchanged_writes=skip_unchanged_writes,
+            pooled=pooled,
+            adaptive_alarm_polling=adaptive_alarm_polling,
+        )
         await client.connect()
         _LOGGER.debug("Client created and connected to %s:%s", host, port)
+
+        if cache_ttl > 0:
+            try:
+                await client.async_get_data()
+            except SaunumException as err:
+                # Leave reporting read failures to the caller's first request
+                _LOGGER.debug("Initial read from %s:%s failed: %s", host, port, err)
+
         return client
 
     @property
@@ -172,31 +471,107 @@ class SaunumClient:
     async def connect(self) -> None:
         """Connect to the sauna controller.
 
+        Does nothing if the connection is already established. When
+        cache_ttl is set, a first read is started in the background so the
+        cache is warm for the first async_get_data call.
+
         Raises:
             SaunumConnectionError: If connection fails
             SaunumTimeoutError: If connection times out
         """
-        try:
-            await self._client.connect()
-            if not self._client.connected:
-                raise SaunumConnectionError(
-                    f"Failed to connect to {self._host}:{self._port}"
+        if self._pooled:
+            # The pool may have been closed and refilled since the last call
+            self._join_pool()
+
+        async with self._connect_lock:
+            if self._client.connected:
+                _LOGGER.debug("Already connected to %s:%s", self._host, self._port)
+                return
+
+            try:
+                await self._client.connect()
+                if not self._client.connected:
+                    raise SaunumConnectionError(
+                        f"Failed to connect to {self._host}:{self._port}"
+                    )
+                _LOGGER.debug("Connected to %s:%s", self._host, self._port)
+                self._configure_socket()
+                if self._cache_ttl > 0:
+                    # Warm the cache in the background; the first async_get_data
+                    # call joins this read instead of starting its own
+                    self._start_fetch()
+            except TimeoutError as err:
+                _LOGGER.debug("Timeout connecting to %s:%s", self._host, self._port)
+                raise SaunumTimeoutError(
+                    f"Timeout connecting to {self._host}:{self._port}"
+                ) from err
+            except (OSError, ModbusException) as err:
+                _LOGGER.debug(
+                    "Failed to connect to %s:%s: %s", self._host, self._port, err
                 )
-            _LOGGER.debug("Connected to %s:%s", self._host, self._port)
-        except TimeoutError as err:
-            _LOGGER.debug("Timeout connecting to %s:%s", self._host, self._port)
-            raise SaunumTimeoutError(
-                f"Timeout connecting to {self._host}:{self._port}"
-            ) from err
-        except (OSError, ModbusException) as err:
-            _LOGGER.debug("Failed to connect to %s:%s: %s", self._host, self._port, err)
-            raise SaunumConnectionError(
-                f"Failed to connect to {self._host}:{self._port}: {err}"
-            ) from err
+                raise SaunumConnectionError(
+                    f"Failed to connect to {self._host}:{self._port}: {err}"
+                ) from err
+
+    def _configure_socket(self) -> None:
+        """Tune the connected socket for small, latency-sensitive requests."""
+        try:
+            transport = self._client.ctx.transport
+        except AttributeError as err:
+            # Not part of the public pymodbus API, so it may change
+            _LOGGER.debug("No transport available to configure: %s", err)
+            return
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            _LOGGER.debug("No socket available to configure")
+            return
 
-    async def async_get_data(self) -> SaunumData:
+        try:
+            # Send each request immediately instead of waiting on Nagle
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for level, option, value in _KEEPALIVE_OPTIONS:
+                sock.setsockopt(level, option, value)
+        except OSError as err:
+            _LOGGER.debug("Failed to set socket options: %s", err)
+
+    async def _async_reconnect(self) -> None:
+        """Re-establish a dropped connection, retrying with increasing delays.
+
+        Concurrent callers share one reconnect; callers that were waiting
+        return as soon as the connection is back.
+
+        Raises:
+            SaunumConnectionError: If every reconnect attempt fails
+            SaunumTimeoutError: If the last reconnect attempt times out
+        """
+        async with self._reconnect_lock:
+            if self._client.connected:
+                return
+
+            _LOGGER.debug("Reconnecting to %s:%s", self._host, self._port)
+            for delay in RECONNECT_DELAYS:
+                try:
+                    await self.connect()
+                except (SaunumConnectionError, SaunumTimeoutError) as err:
+                    _LOGGER.debug(
+                        "Reconnect failed (%s), retrying in %.1fs", err, delay
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    return
+            await self.connect()
+
+    async def async_get_data(self, force_refresh: bool = False) -> SaunumData:
         """Fetch current data from the sauna controller.
 
+        Concurrent callers share a single in-flight read. When cache_ttl is
+        set, data read within the last cache_ttl seconds is returned without
+        contacting the controller.
+
+        Args:
+            force_refresh: Ignore cached data and read from the controller
+
         Returns:
             SaunumData object with current state
 
@@ -206,45 +581,193 @@ class SaunumClient:
             SaunumTimeoutError: If request times out
             SaunumInvalidDataError: If response data is invalid
         """
-        if not self._client.connected:
-            raise SaunumConnectionError("Not connected to sauna controller")
+        if (
+            not force_refresh
+            and self._cache_value is not None
+            and asyncio.get_running_loop().time() < self._cache_expiry
+        ):
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Returning cached data for %s:%s", self._host, self._port)
+            return self._cache_value
 
-        _LOGGER.debug("Fetching data from %s:%s", self._host, self._port)
+        # Shield the shared read so one caller being cancelled does not
+        # cancel it for everyone else waiting on it
+        return await asyncio.shield(self._start_fetch())
 
-        try:
-            # Read control parameters (registers 0-6)
-            control_result = await self._client.read_holding_registers(
-                address=REG_SESSION_ACTIVE,
-                count=7,
-                device_id=self._device_id,
-            )
-            control_regs = _validate_registers(
-                "control", control_result, expected_count=7
-            )
+    async def async_stream_updates(
+        self, interval: float = DEFAULT_UPDATE_INTERVAL
+    ) -> AsyncGenerator[SaunumData, None]:
+        """Poll the controller and yield data whenever it changes.
+
+        The first successful read is always yielded; later reads are only
+        yielded when they differ from the previous one. Communication errors
+        and timeouts are logged and polling continues.
 
-            # Read status sensors (registers 100-104)
-            status_result = await self._client.read_holding_registers(
-                address=REG_CURRENT_TEMP,
-                count=5,
-                device_id=self._device_id,
+        Args:
+            interval: Seconds to wait between reads (default: 1)
+
+        Yields:
+            SaunumData object each time the state changes
+
+        Raises:
+            ValueError: If interval is not positive
+            SaunumConnectionError: If not connected
+            SaunumInvalidDataError: If response data is invalid
+
+        Example:
+            >>> async for data in client.async_stream_updates(interval=5):
+            ...     print(data.current_temperature)
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval {interval} must be positive")
+
+        last: SaunumData | None = None
+        while True:
+            try:
+                data = await self.async_get_data()
+            except (SaunumCommunicationError, SaunumTimeoutError) as err:
+                _LOGGER.debug("Polling %s:%s failed: %s", self._host, self._port, err)
+            else:
+                if data != last:
+                    last = data
+                    yield data
+            await asyncio.sleep(interval)
+
+    def _start_fetch(self) -> asyncio.Task[SaunumData]:
+        """Return the in-flight read, starting one if none is running."""
+        task = self._data_task
+        if task is None:
+            task = self._data_task = asyncio.create_task(self._async_fetch_data())
+            task.add_done_callback(self._on_data_fetched)
+        return task
+
+    def _on_data_fetched(self, task: asyncio.Task[SaunumData]) -> None:
+        """Release the finished in-flight read and cache its result."""
+        current = self._data_task is task
+        if current:
+            self._data_task = None
+
+        # Retrieving the exception also keeps asyncio from logging it when
+        # every waiting caller was cancelled, or nobody awaited a warm-up read
+        if task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            _LOGGER.debug("Read from %s:%s failed: %s", self._host, self._port, err)
+            return
+
+        if current and self._cache_ttl > 0:
+            self._cache_value = task.result()
+            self._cache_expiry = asyncio.get_running_loop().time() + self._cache_ttl
+
+    def _on_write_done(self, task: asyncio.Task[None]) -> None:
+        """Release a finished background write and log its failure."""
+        self._pending_writes.discard(task)
+        if task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            _LOGGER.warning("Background write failed: %s", err)
+
+    def _invalidate_data(self) -> None:
+        """Drop cached data and detach any in-flight read."""
+        self._cache_value = None
+        self._cache_expiry = 0.0
+        self._control_cache = None
+        self._data_task = None
+        # A write may raise an alarm, such as opening the door
+        self._alarm_poll_stride = 1
+        self._alarm_polls_skipped = 0
+
+    async def _async_read_blocks(
+        self, plan: list[tuple[int, int, list[tuple[str, int, int]]]]
+    ) -> list[list[int]]:
+        """Read the register blocks of a read plan.
+
+        The reads are requested together instead of waiting for each
+        response in turn, then split back into the original blocks.
+
+        Args:
+            plan: Reads as returned by _plan_reads
+
+        Returns:
+            Registers of each block in address order
+        """
+        read = self._read
+        results = await asyncio.gather(
+            *(
+                self._async_request(partial(read, address=start, count=count))
+                for start, count, _ in plan
             )
-            status_regs = _validate_registers("status", status_result, expected_count=5)
+        )
+
+        blocks: list[list[int]] = []
+        for (start, count, members), result in zip(plan, results, strict=True):
+            name = " and ".join(member[0] for member in members)
+            registers = _validate_registers(name, result, expected_count=count)
+            for _, address, block_count in members:
+                offset = address - start
+                blocks.append(registers[offset : offset + block_count])
+        return blocks
+
+    async def _async_fetch_data(self) -> SaunumData:
+        """Read and parse all register blocks from the sauna controller."""
+        # Skip building log arguments on every poll unless debug is enabled
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Fetching data from %s:%s", self._host, self._port)
 
-            # Read alarm status (registers 200-205)
-            alarm_result = await self._client.read_holding_registers(
-                address=REG_ALARM_DOOR_OPEN,
-                count=6,
-                device_id=self._device_id,
+        try:
+            now = asyncio.get_running_loop().time()
+            # Control registers only change through writes, which clear
+            # this cache, or from the panel, which the TTL bounds
+            cached_control = self._control_cache
+            if now >= self._control_cache_expiry:
+                cached_control = None
+            read_alarm = self._alarm_polls_skipped + 1 >= self._alarm_poll_stride
+            blocks = iter(
+                await self._async_read_blocks(
+                    self._read_plans[cached_control is None, read_alarm]
+                )
             )
-            alarm_regs = _validate_registers("alarm", alarm_result, expected_count=6)
+            # A write during the read detaches this task; what it read may
+            # then predate the write and must not update the client's state
+            current = self._data_task is asyncio.current_task()
+
+            if cached_control is None:
+                control_regs = next(blocks)
+                if current:
+                    if self._control_cache_ttl > 0:
+                        self._control_cache = control_regs
+                        self._control_cache_expiry = now + self._control_cache_ttl
+                    if self._skip_unchanged_writes:
+                        self._known_values.update(
+                            enumerate(control_regs, start=REG_SESSION_ACTIVE)
+                        )
+            else:
+                control_regs = cached_control
+            status_regs = next(blocks)
+
+            alarm_regs: Sequence[int]
+            if read_alarm:
+                alarm_regs = next(blocks)
+                if self._adaptive_alarm_polling and current:
+                    # Back off while all alarms are clear, check every read
+                    # again as soon as one is raised
+                    self._alarm_polls_skipped = 0
+                    self._alarm_poll_stride = (
+                        1
+                        if any(alarm_regs)
+                        else min(self._alarm_poll_stride * 2, MAX_ALARM_POLL_STRIDE)
+                    )
+            else:
+                if current:
+                    self._alarm_polls_skipped += 1
+                alarm_regs = _QUIET_ALARMS
 
             # Parse control parameters
-            session_active = bool(control_regs[0])
+            session_active = control_regs[0] != 0
             sauna_type_raw = control_regs[1]
-            sauna_type: SaunaType | int = (
-                SaunaType(sauna_type_raw)
-                if sauna_type_raw in SaunaType
-                else sauna_type_raw
+            sauna_type: SaunaType | int = _SAUNA_TYPES.get(
+                sauna_type_raw, sauna_type_raw
             )
             sauna_duration = control_regs[2]
             fan_duration = control_regs[3]
@@ -259,15 +782,12 @@ class SaunumClient:
                 )
 
             fan_speed_raw = control_regs[5]
-            fan_speed: FanSpeed | None
-            if fan_speed_raw in FanSpeed:
-                fan_speed = FanSpeed(fan_speed_raw)
-            else:
+            fan_speed = _FAN_SPEEDS.get(fan_speed_raw)
+            if fan_speed is None:
                 _LOGGER.debug(
                     "Invalid fan speed %d received (expected 0-3)", fan_speed_raw
                 )
-                fan_speed = None
-            light_on = bool(control_regs[6])
+            light_on = control_regs[6] != 0
 
             # Parse status sensors
             current_temp = float(_decode_int16(status_regs[0]))
@@ -276,44 +796,47 @@ class SaunumClient:
             on_time = (status_regs[1] << 16) | status_regs[2]
 
             heater_elements_active = status_regs[3]
-            door_open = bool(status_regs[4])
+            door_open = status_regs[4] != 0
 
             # Parse alarm status
-            alarm_door_open = bool(alarm_regs[0])
-            alarm_door_sensor = bool(alarm_regs[1])
-            alarm_thermal_cutoff = bool(alarm_regs[2])
-            alarm_internal_temp = bool(alarm_regs[3])
-            alarm_temp_sensor_short = bool(alarm_regs[4])
-            alarm_temp_sensor_open = bool(alarm_regs[5])
-
+            alarm_door_open = alarm_regs[0] != 0
+            alarm_door_sensor = alarm_regs[1] != 0
+            alarm_thermal_cutoff = alarm_regs[2] != 0
+            alarm_internal_temp = alarm_regs[3] != 0
+            alarm_temp_sensor_short = alarm_regs[4] != 0
+            alarm_temp_sensor_open = alarm_regs[5] != 0
+
+            # Positional arguments in SaunumData field order, which skips
+            # keyword matching on every poll
             data = SaunumData(
-                session_active=session_active,
-                sauna_type=sauna_type,
-                sauna_duration=sauna_duration,
-                fan_duration=fan_duration,
-                target_temperature=target_temp,
-                fan_speed=fan_speed,
-                light_on=light_on,
-                current_temperature=current_temp,
-                on_time=on_time,
-                heater_elements_active=heater_elements_active,
-                door_open=door_open,
-                alarm_door_open=alarm_door_open,
-                alarm_door_sensor=alarm_door_sensor,
-                alarm_thermal_cutoff=alarm_thermal_cutoff,
-                alarm_internal_temp=alarm_internal_temp,
-                alarm_temp_sensor_short=alarm_temp_sensor_short,
-                alarm_temp_sensor_open=alarm_temp_sensor_open,
-            )
-
-            _LOGGER.debug(
-                "Data fetched: session=%s, temp=%s°C, target=%s°C, heaters=%s",
                 session_active,
-                current_temp,
+                sauna_type,
+                sauna_duration,
+                fan_duration,
                 target_temp,
+                fan_speed,
+                light_on,
+                current_temp,
+                on_time,
                 heater_elements_active,
+                door_open,
+                alarm_door_open,
+                alarm_door_sensor,
+                alarm_thermal_cutoff,
+                alarm_internal_temp,
+                alarm_temp_sensor_short,
+                alarm_temp_sensor_open,
             )
 
+            if debug:
+                _LOGGER.debug(
+                    "Data fetched: session=%s, temp=%s°C, target=%s°C, heaters=%s",
+                    session_active,
+                    current_temp,
+                    target_temp,
+                    heater_elements_active,
+                )
+
             return data
 
         except TimeoutError as err:
@@ -321,6 +844,9 @@ class SaunumClient:
             raise SaunumTimeoutError(
                 f"Timeout communicating with {self._host}:{self._port}"
             ) from err
+        except ConnectionException as err:
+            _LOGGER.debug("Not connected to %s:%s: %s", self._host, self._port, err)
+            raise SaunumConnectionError("Not connected to sauna controller") from err
         except ModbusException as err:
             _LOGGER.debug("Modbus error fetching data: %s", err)
             raise SaunumCommunicationError(
@@ -371,13 +897,7 @@ class SaunumClient:
             Setting temperature to 0 tells the controller to use the default
             temperature defined for the currently selected sauna type.
         """
-        if temperature < 0 or (
-            temperature != 0 and not MIN_TEMPERATURE <= temperature <= MAX_TEMPERATURE
-        ):
-            raise ValueError(
-                f"Temperature {temperature}°C out of range "
-                f"(0=type defined, {MIN_TEMPERATURE}-{MAX_TEMPERATURE}°C)"
-            )
+        _check_target_temperature(temperature)
 
         _LOGGER.debug("Setting target temperature to %d°C", temperature)
         await self._async_write_register(REG_TARGET_TEMPERATURE, temperature)
@@ -400,11 +920,7 @@ class SaunumClient:
             Setting duration to 0 tells the controller to use the default
             duration defined for the currently selected sauna type.
         """
-        if not MIN_DURATION <= minutes <= MAX_DURATION:
-            raise ValueError(
-                f"Duration {minutes} minutes out of range "
-                f"({MIN_DURATION}-{MAX_DURATION})"
-            )
+        _check_sauna_duration(minutes)
 
         _LOGGER.debug("Setting sauna duration to %d minutes", minutes)
         await self._async_write_register(REG_SAUNA_DURATION, minutes)
@@ -427,11 +943,7 @@ class SaunumClient:
             Setting fan duration to 0 tells the controller to use the default
             fan duration defined for the currently selected sauna type.
         """
-        if not MIN_FAN_DURATION <= minutes <= MAX_FAN_DURATION:
-            raise ValueError(
-                f"Fan duration {minutes} minutes out of range "
-                f"({MIN_FAN_DURATION}-{MAX_FAN_DURATION})"
-            )
+        _check_fan_duration(minutes)
 
         _LOGGER.debug("Setting fan duration to %d minutes", minutes)
         await self._async_write_register(REG_FAN_DURATION, minutes)
@@ -452,10 +964,7 @@ class SaunumClient:
             SaunumConnectionError: If not connected
             SaunumCommunicationError: If write operation fails
         """
-        if speed not in FanSpeed:
-            raise ValueError(
-                f"Fan speed {speed} out of range ({FanSpeed.OFF}-{FanSpeed.HIGH})"
-            )
+        _check_fan_speed(speed)
 
         _LOGGER.debug("Setting fan speed to %d", speed)
         await self._async_write_register(REG_FAN_SPEED, speed)
@@ -480,21 +989,24 @@ class SaunumClient:
             duration, and fan settings. Refer to your controller's manual for
             specific type configurations.
         """
-        if sauna_type not in SaunaType:
-            raise ValueError(
-                f"Sauna type {sauna_type} invalid. "
-                f"Use {SaunaType.TYPE_1}, {SaunaType.TYPE_2}, or {SaunaType.TYPE_3}"
-            )
+        _check_sauna_type(sauna_type)
 
         _LOGGER.debug("Setting sauna type to %d", sauna_type)
         await self._async_write_register(REG_SAUNA_TYPE, sauna_type)
         _LOGGER.debug("Sauna type set to %d", sauna_type)
 
-    async def async_set_light_control(self, enabled: bool) -> None:
+    async def async_set_light_control(
+        self, enabled: bool, await_ack: bool = True
+    ) -> None:
         """Set light on/off control.
 
         Args:
             enabled: True to turn light on, False to turn off
+            await_ack: Wait for the controller to acknowledge the write.
+                When False, the write is sent in the background and this
+                returns immediately; failures are logged instead of raised,
+                and pending writes finish before async_close closes the
+                connection. Light writes land in call order either way.
 
         Raises:
             SaunumConnectionError: If not connected
@@ -502,9 +1014,155 @@ class SaunumClient:
         """
         value = STATUS_ON if enabled else STATUS_OFF
         _LOGGER.debug("Setting light to %s", "on" if enabled else "off")
-        await self._async_write_register(REG_LIGHT_CONTROL, value)
+        task = self._queue_write(REG_LIGHT_CONTROL, value)
+        if not await_ack:
+            self._pending_writes.add(task)
+            task.add_done_callback(self._on_write_done)
+            return
+
+        await task
         _LOGGER.debug("Light turned %s", "on" if enabled else "off")
 
+    def _queue_write(self, address: int, value: int) -> asyncio.Task[None]:
+        """Write a register once the writes queued for it before are done.
+
+        Writes to the same register land in call order, so a retried
+        background write cannot overwrite a newer value.
+        """
+        previous = self._queued_writes.get(address)
+        task = asyncio.create_task(
+            self._async_write_register_after(previous, address, value)
+        )
+        self._queued_writes[address] = task
+        return task
+
+    async def _async_write_register_after(
+        self, previous: asyncio.Task[None] | None, address: int, value: int
+    ) -> None:
+        """Write a register after an earlier write, whatever its outcome."""
+        if previous is not None:
+            await asyncio.wait((previous,))
+        await self._async_write_register(address, value)
+
+    async def async_apply_settings(
+        self,
+        *,
+        session_active: bool | None = None,
+        sauna_type: int | None = None,
+        sauna_duration: int | None = None,
+        fan_duration: int | None = None,
+        target_temperature: int | None = None,
+        fan_speed: int | None = None,
+        light_on: bool | None = None,
+    ) -> None:
+        """Write several settings in as few requests as possible.
+
+        Settings left as None are not changed. All values are validated
+        before anything is written, and settings in consecutive registers
+        are sent in a single write. Starting the session is written in a
+        separate request after the other settings, so the session starts
+        with the new configuration.
+
+        Args:
+            session_active: True to start the session, False to stop it
+            sauna_type: Sauna type (0-2)
+            sauna_duration: Session duration in minutes (0-720)
+            fan_duration: Fan duration in minutes (0-30)
+            target_temperature: Target temperature (0, or 40-100°C)
+            fan_speed: Fan speed (0-3)
+            light_on: True to turn the light on, False to turn it off
+
+        Raises:
+            ValueError: If any value is out of range
+            SaunumConnectionError: If not connected
+            SaunumCommunicationError: If write operation fails
+
+        Example:
+            >>> await client.async_apply_settings(
+            ...     sauna_type=SaunaType.TYPE_2,
+            ...     target_temperature=85,
+            ...     session_active=True,
+            ... )
+        """
+        values: dict[int, int] = {}
+        if session_active is not None:
+            values[REG_SESSION_ACTIVE] = STATUS_ON if session_active else STATUS_OFF
+        if sauna_type is not None:
+            _check_sauna_type(sauna_type)
+            values[REG_SAUNA_TYPE] = sauna_type
+        if sauna_duration is not None:
+            _check_sauna_duration(sauna_duration)
+            values[REG_SAUNA_DURATION] = sauna_duration
+        if fan_duration is not None:
+            _check_fan_duration(fan_duration)
+            values[REG_FAN_DURATION] = fan_duration
+        if target_temperature is not None:
+            _check_target_temperature(target_temperature)
+            values[REG_TARGET_TEMPERATURE] = target_temperature
+        if fan_speed is not None:
+            _check_fan_speed(fan_speed)
+            values[REG_FAN_SPEED] = fan_speed
+        if light_on is not None:
+            values[REG_LIGHT_CONTROL] = STATUS_ON if light_on else STATUS_OFF
+
+        if not values:
+            _LOGGER.debug("No settings to apply")
+            return
+
+        _LOGGER.debug("Applying settings %s", values)
+        if values.get(REG_SESSION_ACTIVE) == STATUS_ON:
+            del values[REG_SESSION_ACTIVE]
+            if values:
+                await self._async_write_registers(values)
+            await self._async_write_registers({REG_SESSION_ACTIVE: STATUS_ON})
+        else:
+            await self._async_write_registers(values)
+        _LOGGER.debug("Settings applied")
+
+    async def _async_request(
+        self, request: Callable[[], Awaitable[ModbusPDU]]
+    ) -> ModbusPDU:
+        """Run a Modbus request, retrying transient errors.
+
+        pymodbus bounds each attempt by the client timeout once the request
+        is sent, so time spent queued behind other requests on the
+        connection does not count against it. A ModbusException, including
+        a response that did not arrive in time, is retried up to the
+        configured number of times with exponential backoff; error
+        responses from the controller are not retried. When
+        the connection is down, the request is retried once after
+        reconnecting if auto_reconnect is set.
+
+        Args:
+            request: Callable issuing the request
+
+        Returns:
+            Response from the controller
+
+        Raises:
+            ConnectionException: If not connected
+            ModbusException: If the last attempt fails
+        """
+        attempt = 0
+        reconnected = False
+        while True:
+            try:
+                return await request()
+            except ConnectionException:
+                if not self._auto_reconnect or reconnected:
+                    raise
+                reconnected = True
+                await self._async_reconnect()
+            except ModbusException as err:
+                if attempt >= self._retries:
+                    raise
+                delay = RETRY_BACKOFF * 2**attempt
+                attempt += 1
+                _LOGGER.debug(
+                    "Modbus request failed (%s), retry %d in %.2fs", err, attempt, delay
+                )
+                await asyncio.sleep(delay)
+
     async def _async_write_register(self, address: int, value: int) -> None:
         """Write a single holding register.
 
@@ -516,43 +1174,126 @@ class SaunumClient:
             SaunumConnectionError: If not connected
             SaunumCommunicationError: If write operation fails
         """
-        if not self._client.connected:
-            raise SaunumConnectionError("Not connected to sauna controller")
+        await self._async_write_registers({address: value})
+
+    async def _async_write_registers(self, values: dict[int, int]) -> None:
+        """Write holding registers, batching runs of adjacent addresses.
+
+        Each run of consecutive addresses is sent as one write multiple
+        registers (FC16) request; a lone register uses write single
+        register (FC6). With skip_unchanged_writes, values the controller
+        is known to hold already are left out.
+
+        Args:
+            values: Values to write, keyed by register address
 
-        _LOGGER.debug("Writing register %d = %d", address, value)
+        Raises:
+            SaunumConnectionError: If not connected
+            SaunumCommunicationError: If write operation fails
+        """
+        known = self._known_values
+        if self._skip_unchanged_writes:
+            values = {
+                address: value
+                for address, value in values.items()
+                if address in _DEVICE_CHANGED_REGISTERS or known.get(address) != value
+            }
+            if not values:
+                _LOGGER.debug("Registers already hold the values, skipping write")
+                return
+            # Until the write succeeds, the register values are unknown
+            for address in values:
+                known.pop(address, None)
+
+        runs: list[tuple[int, list[int]]] = []
+        for address, value in sorted(values.items()):
+            if runs and address == runs[-1][0] + len(runs[-1][1]):
+                runs[-1][1].append(value)
+            else:
+                runs.append((address, [value]))
 
+        target = ""
         try:
-            result = await self._client.write_register(
-                address=address,
-                value=value,
-                device_id=self._device_id,
-            )
-            if result.isError():
-                raise SaunumCommunicationError(
-                    f"Failed to write register {address}: {result}"
-                )
+            for address, run_values in runs:
+                if len(run_values) == 1:
+                    target = f"register {address}"
+                    _LOGGER.debug("Writing register %d = %d", address, run_values[0])
+                    result = await self._async_request(
+                        partial(self._write, address=address, value=run_values[0])
+                    )
+                else:
+                    target = f"registers {address}-{address + len(run_values) - 1}"
+                    _LOGGER.debug("Writing %s = %s", target, run_values)
+                    result = await self._async_request(
+                        partial(
+                            self._write_multiple, address=address, values=run_values
+                        )
+                    )
+                if result.isError():
+                    raise SaunumCommunicationError(
+                        f"Failed to write {target}: {result}"
+                    )
+                if self._skip_unchanged_writes:
+                    known.update(enumerate(run_values, start=address))
 
         except TimeoutError as err:
-            _LOGGER.debug("Timeout writing register %d", address)
+            _LOGGER.debug("Timeout writing %s", target)
             raise SaunumTimeoutError(
-                f"Timeout writing register {address} to {self._host}:{self._port}"
+                f"Timeout writing {target} to {self._host}:{self._port}"
             ) from err
+        except ConnectionException as err:
+            _LOGGER.debug("Not connected to %s:%s: %s", self._host, self._port, err)
+            raise SaunumConnectionError("Not connected to sauna controller") from err
         except ModbusException as err:
-            _LOGGER.debug("Modbus error writing register %d: %s", address, err)
+            _LOGGER.debug("Modbus error writing %s: %s", target, err)
             raise SaunumCommunicationError(
-                f"Modbus error writing register {address}: {err}"
+                f"Modbus error writing {target}: {err}"
             ) from err
+        finally:
+            # The controller state may have changed, so the next read must
+            # not be served from data read before this write
+            self._invalidate_data()
 
     async def async_close(self) -> None:
-        """Close the connection to the sauna controller."""
+        """Close the connection to the sauna controller.
+
+        Background writes started with await_ack=False are finished first.
+        """
+        if self._pending_writes:
+            _LOGGER.debug("Waiting for %d pending writes", len(self._pending_writes))
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+        if self._pooled:
+            # Leave the shared connection open for the next pooled client
+            _LOGGER.debug("Releasing connection to %s:%s", self._host, self._port)
+            self._invalidate_data()
+            self._known_values.clear()
+            return
+
         if not self._client.connected:
             _LOGGER.debug("Already disconnected from %s:%s", self._host, self._port)
             return
 
         _LOGGER.debug("Closing connection to %s:%s", self._host, self._port)
+        self._invalidate_data()
+        self._known_values.clear()
         self._client.close()
         _LOGGER.debug("Disconnected from %s:%s", self._host, self._port)
 
+    @classmethod
+    async def async_close_pool(cls) -> None:
+        """Close the connections shared by clients created with pooled=True.
+
+        Only meant for shutdown: pooled clients still in use lose their
+        connection. Connections pooled on other event loops are left alone,
+        and those of closed loops are forgotten.
+        """
+        cls._drop_closed_loops()
+        loop = asyncio.get_running_loop()
+        for key in [key for key in cls._pool if key[0] is loop]:
+            cls._pool.pop(key).close()
+            cls._pool_locks.pop(key, None)
+
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
         await self.connect()
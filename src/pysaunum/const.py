@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 from typing import Final
 
 __all__ = [
     "DEFAULT_PORT",
     "DEFAULT_DEVICE_ID",
     "DEFAULT_TIMEOUT",
+    "DEFAULT_CACHE_TTL",
+    "DEFAULT_CONTROL_CACHE_TTL",
+    "DEFAULT_RETRIES",
+    "DEFAULT_UPDATE_INTERVAL",
     "MIN_TEMPERATURE",
     "MAX_TEMPERATURE",
     "DEFAULT_TEMPERATURE",
@@ -21,14 +25,24 @@ __all__ = [
     "MIN_FAN_SPEED",
     "MAX_FAN_SPEED",
     "DEFAULT_FAN_SPEED",
+    "AlarmFlag",
     "FanSpeed",
     "SaunaType",
+    "FAN_SPEED_VALUES",
+    "SAUNA_TYPE_VALUES",
 ]
 
 # Default connection settings
 DEFAULT_PORT: Final = 502
 DEFAULT_DEVICE_ID: Final = 1
 DEFAULT_TIMEOUT: Final = 10.0  # seconds
+DEFAULT_CACHE_TTL: Final = 0.0  # seconds, 0 disables caching of read data
+DEFAULT_CONTROL_CACHE_TTL: Final = 0.0  # seconds, 0 always reads control registers
+DEFAULT_RETRIES: Final = 2  # retries after a Modbus error
+DEFAULT_UPDATE_INTERVAL: Final = 1.0  # seconds between async_stream_updates reads
+RETRY_BACKOFF: Final = 0.05  # seconds before the first retry, doubled each time
+RECONNECT_DELAYS: Final = (0.1, 0.3, 1.0)  # seconds between reconnect attempts
+MAX_ALARM_POLL_STRIDE: Final = 8  # quiet alarms are read at least every 8th poll
 
 # Modbus register addresses - Holding Registers (Read/Write Control Parameters)
 REG_SESSION_ACTIVE: Final = 0  # Session on/off control 0=Off, 1=On
@@ -91,6 +105,23 @@ class SaunaType(IntEnum):
     TYPE_3 = 2
 
 
+# Raw register values of the enums above, for membership tests on plain ints
+FAN_SPEED_VALUES: Final = frozenset(speed.value for speed in FanSpeed)
+SAUNA_TYPE_VALUES: Final = frozenset(sauna_type.value for sauna_type in SaunaType)
+
+
+# Alarm flags, one bit per alarm register in address order
+class AlarmFlag(IntFlag):
+    """Alarm status flags."""
+
+    DOOR_OPEN = 1  # REG_ALARM_DOOR_OPEN
+    DOOR_SENSOR = 2  # REG_ALARM_DOOR_SENSOR
+    THERMAL_CUTOFF = 4  # REG_ALARM_THERMAL_CUTOFF
+    INTERNAL_TEMP = 8  # REG_ALARM_INTERNAL_TEMP
+    TEMP_SENSOR_SHORT = 16  # REG_ALARM_TEMP_SENSOR_SHORT
+    TEMP_SENSOR_OPEN = 32  # REG_ALARM_TEMP_SENSOR_OPEN
+
+
 # Status values
 STATUS_OFF: Final = 0
 STATUS_ON: Final = 1
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from .const import FanSpeed, SaunaType
+from .const import AlarmFlag, FanSpeed, SaunaType
 
 __all__ = ["SaunumData"]
 
+# Every combination of the six alarm bits, built once instead of per read
+_ALARM_FLAGS = tuple(AlarmFlag(mask) for mask in range(1 << len(AlarmFlag)))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SaunumData:
     """Data from Saunum sauna controller.
 
@@ -70,3 +73,15 @@ class SaunumData:
 
     alarm_temp_sensor_open: bool
     """Alarm: temperature sensor not connected."""
+
+    @property
+    def alarm_flags(self) -> AlarmFlag:
+        """Active alarms as AlarmFlag bits, falsy when no alarm is active."""
+        return _ALARM_FLAGS[
+            self.alarm_door_open
+            | self.alarm_door_sensor << 1
+            | self.alarm_thermal_cutoff << 2
+            | self.alarm_internal_temp << 3
+            | self.alarm_temp_sensor_short << 4
+            | self.alarm_temp_sensor_open << 5
+        ]
@@ -5,11 +5,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from pysaunum import SaunumClient
+from pysaunum import client as pysaunum_client
+
+from .helpers import _response
+
+
+@pytest.fixture(autouse=True)
+def no_backoff() -> Iterator[None]:
+    """Skip the delays between retries and reconnect attempts."""
+    with (
+        patch.object(pysaunum_client, "RETRY_BACKOFF", 0),
+        patch.object(pysaunum_client, "RECONNECT_DELAYS", (0, 0, 0)),
+    ):
+        yield
+
 
 @pytest.fixture
 def mock_modbus_client() -> Iterator[MagicMock]:
     """Mock the AsyncModbusTcpClient."""
-    with patch("pysaunum.client.AsyncModbusTcpClient") as mock_client:
+    with patch.object(pysaunum_client, "AsyncModbusTcpClient") as mock_client:
         # Set up the mock client instance
         mock_instance = MagicMock()
         mock_client.return_value = mock_instance
@@ -18,15 +33,25 @@ def mock_modbus_client() -> Iterator[MagicMock]:
         mock_instance.connected = False
 
         # Mock successful connection
-        mock_instance.connect = AsyncMock(return_value=None)
+        async def connect() -> bool:
+            mock_instance.connected = True
+            return True
+
+        mock_instance.connect = AsyncMock(side_effect=connect)
         mock_instance.close = MagicMock(return_value=None)
 
         # Mock successful read operations
         mock_instance.read_holding_registers = AsyncMock()
 
-        # Mock successful write operation
-        mock_write_result = MagicMock()
-        mock_write_result.isError.return_value = False
+        # Mock successful write operations
+        mock_write_result = _response()
         mock_instance.write_register = AsyncMock(return_value=mock_write_result)
+        mock_instance.write_registers = AsyncMock(return_value=mock_write_result)
 
         yield mock_instance
+
+
+@pytest.fixture
+def client(mock_modbus_client: MagicMock) -> SaunumClient:
+    """Return a client for the mocked Modbus client."""
+    return SaunumClient(host="192.168.1.100")
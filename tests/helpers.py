@@ -0,0 +1,13 @@
+"""Helpers shared by the pysaunum tests."""
+
+from types import SimpleNamespace
+
+
+def _no_error() -> bool:
+    """Report success from a response's isError(); shared by all responses."""
+    return False
+
+
+def _response(registers: list[int] | None = None) -> SimpleNamespace:
+    """Return a successful Modbus response carrying registers."""
+    return SimpleNamespace(registers=registers, isError=_no_error)
@@ -1,10 +1,16 @@
 """Tests for SaunumClient."""
 # pylint: disable=redefined-outer-name
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import logging
+import socket
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException
 
 from pysaunum import (
     SaunumClient,
@@ -14,17 +20,49 @@ from pysaunum import (
     SaunumInvalidDataError,
     SaunumTimeoutError,
 )
+from pysaunum import client as pysaunum_client
+from pysaunum.client import _plan_reads
 from pysaunum.const import (
     DEFAULT_DEVICE_ID,
+    REG_ALARM_DOOR_OPEN,
+    REG_CURRENT_TEMP,
     REG_SESSION_ACTIVE,
     REG_TARGET_TEMPERATURE,
+    AlarmFlag,
+    FanSpeed,
+    SaunaType,
 )
 
+from .helpers import _no_error, _response
 
-@pytest.mark.usefixtures("mock_modbus_client")
-def test_client_init() -> None:
+# Register blocks served by _mock_registers as (name, address, registers)
+_DEFAULT_BLOCKS = (
+    ("control", REG_SESSION_ACTIVE, (1, 0, 60, 10, 80, 2, 1)),
+    ("status", REG_CURRENT_TEMP, (75, 1800, 900, 1, 0)),
+    ("alarm", REG_ALARM_DOOR_OPEN, (0, 0, 0, 0, 0, 0)),
+)
+
+
+def _mock_registers(mock_modbus_client: MagicMock, **blocks: list[int]) -> None:
+    """Serve holding register reads from a register map.
+
+    Keyword arguments override the default control, status and alarm blocks.
+    """
+    registers: dict[int, int] = {}
+    for name, start, default in _DEFAULT_BLOCKS:
+        for offset, value in enumerate(blocks.get(name, default)):
+            registers[start + offset] = value
+
+    def read(address: int, count: int, **_: Any) -> SimpleNamespace:
+        return _response(
+            [registers.get(reg, 0) for reg in range(address, address + count)]
+        )
+
+    mock_modbus_client.read_holding_registers.side_effect = read
+
+
+def test_client_init(client: SaunumClient) -> None:
     """Test client initialization."""
-    client = SaunumClient(host="192.168.1.100")
     assert client.host == "192.168.1.100"
     assert client.port == 502
     assert client.device_id == 1
@@ -55,53 +93,184 @@ def test_client_init_custom_params() -> None:
 
 
 @pytest.mark.usefixtures("mock_modbus_client")
-def test_client_repr() -> None:
+def test_client_init_negative_cache_ttl() -> None:
+    """Test client initialization with negative cache TTL raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        SaunumClient(host="192.168.1.100", cache_ttl=-1)
+
+
+@pytest.mark.usefixtures("mock_modbus_client")
+def test_client_init_negative_retries() -> None:
+    """Test client initialization with negative retries raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        SaunumClient(host="192.168.1.100", retries=-1)
+
+
+@pytest.mark.usefixtures("mock_modbus_client")
+def test_client_init_negative_control_cache_ttl() -> None:
+    """Test client initialization with negative control cache TTL."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        SaunumClient(host="192.168.1.100", control_cache_ttl=-1)
+
+
+def test_client_repr(client: SaunumClient) -> None:
     """Test client string representation."""
-    client = SaunumClient(host="192.168.1.100")
     assert repr(client) == "SaunumClient(192.168.1.100:502, connected=False)"
 
 
-async def test_connect_success(mock_modbus_client: MagicMock) -> None:
+async def test_connect_success(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test successful connection."""
+    await client.connect()
+
+    mock_modbus_client.connect.assert_called_once()
+    assert client.is_connected
+
+
+async def test_connect_configures_socket(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connect disables Nagle and enables keepalive on the socket."""
+    sock = MagicMock()
+    mock_modbus_client.ctx.transport.get_extra_info.return_value = sock
+
+    await client.connect()
+
+    mock_modbus_client.ctx.transport.get_extra_info.assert_called_once_with("socket")
+    sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+async def test_connect_without_socket(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connect succeeds when the transport exposes no socket."""
+    mock_modbus_client.ctx.transport = None
+
+    await client.connect()
+
+    assert client.is_connected
+
+
+async def test_connect_without_transport(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connect succeeds when pymodbus no longer exposes the transport."""
+    del mock_modbus_client.ctx
+
+    await client.connect()
+
+    assert client.is_connected
+
+
+async def test_connect_socket_options_fail(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connect succeeds when socket options cannot be set."""
+    sock = MagicMock()
+    sock.setsockopt.side_effect = OSError("Operation not supported")
+    mock_modbus_client.ctx.transport.get_extra_info.return_value = sock
+
+    await client.connect()
+
+    assert client.is_connected
+
+
+async def test_connect_already_connected(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connect does not reconnect an established connection."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.connect()
 
-    mock_modbus_client.connect.assert_called_once()
+    mock_modbus_client.connect.assert_not_called()
     assert client.is_connected
 
 
-async def test_connect_failure(mock_modbus_client: MagicMock) -> None:
-    """Test connection failure."""
-    mock_modbus_client.connected = False
+async def test_auto_reconnect(mock_modbus_client: MagicMock) -> None:
+    """Test requests reconnect once and retry after the connection drops."""
+    _mock_registers(mock_modbus_client)
+    read = mock_modbus_client.read_holding_registers.side_effect
+    failures = [ConnectionRefusedError()]
+
+    def read_when_connected(**kwargs: Any) -> SimpleNamespace:
+        if not mock_modbus_client.connected:
+            raise ConnectionException("Not connected")
+        response: SimpleNamespace = read(**kwargs)
+        return response
+
+    async def connect() -> bool:
+        if failures:
+            raise failures.pop()
+        mock_modbus_client.connected = True
+        return True
+
+    mock_modbus_client.read_holding_registers.side_effect = read_when_connected
+    mock_modbus_client.connect.side_effect = connect
+
+    client = SaunumClient(host="192.168.1.100", auto_reconnect=True)
+    data = await client.async_get_data()
+
+    assert data.session_active is True
+    # The three concurrent block reads share one reconnect
+    assert mock_modbus_client.connect.await_count == 2
+    assert mock_modbus_client.read_holding_registers.call_count == 6
+
 
-    client = SaunumClient(host="192.168.1.100")
+async def test_auto_reconnect_fails(mock_modbus_client: MagicMock) -> None:
+    """Test the last reconnect error is raised once attempts run out."""
+    mock_modbus_client.write_register.side_effect = ConnectionException("Not connected")
+    mock_modbus_client.connect.side_effect = ConnectionRefusedError()
+
+    client = SaunumClient(host="192.168.1.100", auto_reconnect=True)
+    with pytest.raises(SaunumConnectionError, match="Failed to connect"):
+        await client.async_start_session()
+
+    assert mock_modbus_client.connect.await_count == 4
+    mock_modbus_client.write_register.assert_called_once()
+
+
+async def test_auto_reconnect_retries_once(mock_modbus_client: MagicMock) -> None:
+    """Test a request is not retried again if it fails after reconnecting."""
+    mock_modbus_client.write_register.side_effect = ConnectionException("Not connected")
+
+    client = SaunumClient(host="192.168.1.100", auto_reconnect=True)
+
+    with pytest.raises(SaunumConnectionError, match="Not connected"):
+        await client.async_start_session()
+
+    mock_modbus_client.connect.assert_awaited_once()
+    assert mock_modbus_client.write_register.call_count == 2
+
+
+async def test_connect_failure(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test connection failure."""
+    mock_modbus_client.connect.side_effect = None
 
     with pytest.raises(SaunumConnectionError):
         await client.connect()
 
 
-async def test_get_data_success(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_success(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test successful data retrieval."""
     mock_modbus_client.connected = True
 
     # Mock control registers response (0-6: session_active, sauna_type, etc.)
-    control_response = MagicMock()
-    control_response.isError.return_value = False
     # session=1, type=0, duration=60, fan_dur=10, temp=80, fan_speed=2, light=1
-    control_response.registers = [1, 0, 60, 10, 80, 2, 1]
+    control_response = _response([1, 0, 60, 10, 80, 2, 1])
 
     # Mock status registers response (100-104: current_temp, on_time, heater, door)
-    status_response = MagicMock()
-    status_response.isError.return_value = False
     # temp=75, on_time_high=1800, on_time_low=900, heater=1, door=0
-    status_response.registers = [75, 1800, 900, 1, 0]
+    status_response = _response([75, 1800, 900, 1, 0])
 
     # Mock alarm registers response (200-205: all alarm states)
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]  # all alarms off
+    alarm_response = _response([0, 0, 0, 0, 0, 0])  # all alarms off
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -109,9 +278,9 @@ async def test_get_data_success(mock_modbus_client: MagicMock) -> None:
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
     data = await client.async_get_data()
 
+    assert mock_modbus_client.read_holding_registers.await_count == 3
     assert isinstance(data, SaunumData)
     assert data.session_active is True
     assert data.sauna_type == 0
@@ -134,6 +303,7 @@ async def test_get_data_success(mock_modbus_client: MagicMock) -> None:
 
 async def test_get_data_negative_current_temperature(
     mock_modbus_client: MagicMock,
+    client: SaunumClient,
 ) -> None:
     """Test current temperature parsing for negative values.
 
@@ -142,17 +312,11 @@ async def test_get_data_negative_current_temperature(
     """
     mock_modbus_client.connected = True
 
-    control_response = MagicMock()
-    control_response.isError.return_value = False
-    control_response.registers = [0, 0, 0, 0, 0, 0, 0]
+    control_response = _response([0, 0, 0, 0, 0, 0, 0])
 
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [65535, 0, 0, 0, 0]
+    status_response = _response([65535, 0, 0, 0, 0])
 
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -160,82 +324,57 @@ async def test_get_data_negative_current_temperature(
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
     data = await client.async_get_data()
 
     assert data.current_temperature == -1.0
 
 
-async def test_get_data_not_connected(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_not_connected(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when not connected."""
-    mock_modbus_client.connected = False
-
-    client = SaunumClient(host="192.168.1.100")
+    mock_modbus_client.read_holding_registers.side_effect = ConnectionException(
+        "Not connected"
+    )
 
     with pytest.raises(SaunumConnectionError):
         await client.async_get_data()
 
 
-async def test_start_session(mock_modbus_client: MagicMock) -> None:
-    """Test starting a session."""
-    mock_modbus_client.connected = True
-
-    write_response = MagicMock()
-    write_response.isError.return_value = False
-    mock_modbus_client.write_register.return_value = write_response
-
-    client = SaunumClient(host="192.168.1.100")
-    await client.async_start_session()
-
-    mock_modbus_client.write_register.assert_called_once_with(
-        address=REG_SESSION_ACTIVE,
-        value=1,
-        device_id=DEFAULT_DEVICE_ID,
-    )
-
-
-async def test_stop_session(mock_modbus_client: MagicMock) -> None:
-    """Test stopping a session."""
-    mock_modbus_client.connected = True
-
-    write_response = MagicMock()
-    write_response.isError.return_value = False
-    mock_modbus_client.write_register.return_value = write_response
-
-    client = SaunumClient(host="192.168.1.100")
-    await client.async_stop_session()
-
-    mock_modbus_client.write_register.assert_called_once_with(
-        address=REG_SESSION_ACTIVE,
-        value=0,
-        device_id=DEFAULT_DEVICE_ID,
-    )
-
-
-async def test_set_temperature_valid(mock_modbus_client: MagicMock) -> None:
-    """Test setting a valid temperature."""
+@pytest.mark.parametrize(
+    ("method", "args", "address", "value"),
+    [
+        ("async_start_session", (), REG_SESSION_ACTIVE, 1),
+        ("async_stop_session", (), REG_SESSION_ACTIVE, 0),
+        ("async_set_target_temperature", (80,), REG_TARGET_TEMPERATURE, 80),
+    ],
+)
+async def test_write_single_register(
+    mock_modbus_client: MagicMock,
+    method: str,
+    args: tuple[int, ...],
+    address: int,
+    value: int,
+    client: SaunumClient,
+) -> None:
+    """Test setters write their value to a single register."""
     mock_modbus_client.connected = True
 
-    write_response = MagicMock()
-    write_response.isError.return_value = False
-    mock_modbus_client.write_register.return_value = write_response
-
-    client = SaunumClient(host="192.168.1.100")
-    await client.async_set_target_temperature(80)
+    await getattr(client, method)(*args)
 
     mock_modbus_client.write_register.assert_called_once_with(
-        address=REG_TARGET_TEMPERATURE,
-        value=80,
+        address=address,
+        value=value,
         device_id=DEFAULT_DEVICE_ID,
     )
 
 
-async def test_set_temperature_invalid(mock_modbus_client: MagicMock) -> None:
+async def test_set_temperature_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting an invalid temperature."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="out of range"):
         await client.async_set_target_temperature(150)
 
@@ -245,8 +384,6 @@ async def test_set_temperature_invalid(mock_modbus_client: MagicMock) -> None:
 
 async def test_context_manager(mock_modbus_client: MagicMock) -> None:
     """Test using client as async context manager."""
-    mock_modbus_client.connected = True
-
     async with SaunumClient(host="192.168.1.100") as client:
         assert client.is_connected
 
@@ -254,37 +391,39 @@ async def test_context_manager(mock_modbus_client: MagicMock) -> None:
     mock_modbus_client.close.assert_called_once()
 
 
-async def test_connect_oserror(mock_modbus_client: MagicMock) -> None:
+async def test_connect_oserror(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test connection failure with OSError."""
     mock_modbus_client.connect.side_effect = OSError("Network unreachable")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumConnectionError, match="Network unreachable"):
         await client.connect()
 
 
-async def test_connect_modbus_exception(mock_modbus_client: MagicMock) -> None:
+async def test_connect_modbus_exception(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test connection failure with ModbusException."""
     mock_modbus_client.connect.side_effect = ModbusException("Modbus error")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumConnectionError, match="Modbus error"):
         await client.connect()
 
 
-async def test_connect_timeout(mock_modbus_client: MagicMock) -> None:
+async def test_connect_timeout(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test connection failure with TimeoutError."""
     mock_modbus_client.connect.side_effect = TimeoutError("Connection timed out")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumTimeoutError, match="Timeout connecting"):
         await client.connect()
 
 
-async def test_get_data_holding_registers_error(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_holding_registers_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when holding registers read fails."""
     mock_modbus_client.connected = True
 
@@ -293,53 +432,63 @@ async def test_get_data_holding_registers_error(mock_modbus_client: MagicMock) -
     holding_response.isError.return_value = True
     mock_modbus_client.read_holding_registers.return_value = holding_response
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(
         SaunumCommunicationError, match="Failed to read control registers"
     ):
         await client.async_get_data()
 
 
-async def test_get_data_sensor_registers_error(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_sensor_registers_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when status registers read fails."""
     mock_modbus_client.connected = True
 
     # Mock successful control registers response
-    control_response = MagicMock()
-    control_response.isError.return_value = False
-    control_response.registers = [1, 0, 60, 10, 80, 2, 1]
+    control_response = _response([1, 0, 60, 10, 80, 2, 1])
 
     # Mock status registers response with error
     status_response = MagicMock()
     status_response.isError.return_value = True
 
+    # Mock successful alarm registers response
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
+
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
         status_response,
+        alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(
         SaunumCommunicationError, match="Failed to read status registers"
     ):
         await client.async_get_data()
 
 
-async def test_get_data_alarm_registers_error(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_alarm_flags(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test alarm_flags is built from the alarm registers."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client, alarm=[0, 0, 1, 0, 0, 2])
+
+    data = await client.async_get_data()
+
+    assert data.alarm_flags == AlarmFlag.THERMAL_CUTOFF | AlarmFlag.TEMP_SENSOR_OPEN
+
+
+async def test_get_data_alarm_registers_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when alarm registers read fails."""
     mock_modbus_client.connected = True
 
     # Mock successful control registers response
-    control_response = MagicMock()
-    control_response.isError.return_value = False
-    control_response.registers = [1, 0, 60, 10, 80, 2, 1]
+    control_response = _response([1, 0, 60, 10, 80, 2, 1])
 
     # Mock successful status registers response
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [75, 1800, 900, 1, 0]
+    status_response = _response([75, 1800, 900, 1, 0])
 
     # Mock alarm registers response with error
     alarm_response = MagicMock()
@@ -351,78 +500,214 @@ async def test_get_data_alarm_registers_error(mock_modbus_client: MagicMock) ->
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(
         SaunumCommunicationError, match="Failed to read alarm registers"
     ):
         await client.async_get_data()
 
 
-async def test_get_data_timeout_error(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_timeout_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when timeout occurs."""
     mock_modbus_client.connected = True
     mock_modbus_client.read_holding_registers.side_effect = TimeoutError("Timeout")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumTimeoutError, match="Timeout communicating"):
         await client.async_get_data()
 
 
-async def test_get_data_modbus_exception(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_queued_reads_not_timed_out(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test gathered reads waiting their turn on the connection succeed."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+    read = mock_modbus_client.read_holding_registers.side_effect
+    transaction = asyncio.Lock()
+
+    async def slow_read(**kwargs: Any) -> SimpleNamespace:
+        # pymodbus runs one transaction at a time on a connection
+        async with transaction:
+            await asyncio.sleep(0.04)
+            response: SimpleNamespace = read(**kwargs)
+            return response
+
+    mock_modbus_client.read_holding_registers.side_effect = slow_read
+
+    # The three reads take longer together than the timeout
+    client = SaunumClient(host="192.168.1.100", timeout=0.1)
+    data = await client.async_get_data()
+
+    assert data.session_active is True
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_get_data_modbus_exception(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when modbus exception occurs."""
     mock_modbus_client.connected = True
     mock_modbus_client.read_holding_registers.side_effect = ModbusException(
         "Modbus error"
     )
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumCommunicationError, match="Modbus communication error"):
         await client.async_get_data()
 
 
-async def test_get_data_invalid_data(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_retries_transient_error(
+    mock_modbus_client: MagicMock,
+    client: SaunumClient,
+) -> None:
+    """Test get_data retries a read after a transient Modbus error."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+    read = mock_modbus_client.read_holding_registers.side_effect
+    failures = [ModbusException("Connection reset")]
+
+    def flaky_read(**kwargs: Any) -> SimpleNamespace:
+        if failures:
+            raise failures.pop()
+        response: SimpleNamespace = read(**kwargs)
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = flaky_read
+
+    data = await client.async_get_data()
+
+    assert data.session_active is True
+    assert mock_modbus_client.read_holding_registers.await_count == 4
+
+
+async def test_get_data_batch_reads(mock_modbus_client: MagicMock) -> None:
+    """Test batch_reads merges blocks that fit in one request."""
+    mock_modbus_client.connected = True
+    _mock_registers(
+        mock_modbus_client,
+        status=[0xFFFB, 0, 30, 2, 1],
+        alarm=[0, 0, 1, 0, 0, 1],
+    )
+
+    client = SaunumClient(host="192.168.1.100", batch_reads=True)
+    data = await client.async_get_data()
+
+    # Control and status span 105 registers; adding alarms would exceed 125
+    assert mock_modbus_client.read_holding_registers.await_count == 2
+    mock_modbus_client.read_holding_registers.assert_any_await(
+        address=REG_SESSION_ACTIVE, count=105, device_id=DEFAULT_DEVICE_ID
+    )
+    mock_modbus_client.read_holding_registers.assert_any_await(
+        address=REG_ALARM_DOOR_OPEN, count=6, device_id=DEFAULT_DEVICE_ID
+    )
+    assert data.session_active is True
+    assert data.light_on is True
+    assert data.current_temperature == -5.0
+    assert data.on_time == 30
+    assert data.heater_elements_active == 2
+    assert data.door_open is True
+    assert data.alarm_thermal_cutoff is True
+    assert data.alarm_temp_sensor_open is True
+    assert data.alarm_door_open is False
+
+
+async def test_get_data_batch_reads_incomplete(mock_modbus_client: MagicMock) -> None:
+    """Test batch_reads rejects a short merged response."""
+    mock_modbus_client.connected = True
+    short_response = _response([1, 0, 60, 10, 80, 2, 1])
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
+    mock_modbus_client.read_holding_registers.side_effect = [
+        short_response,
+        alarm_response,
+    ]
+
+    client = SaunumClient(host="192.168.1.100", batch_reads=True)
+    with pytest.raises(
+        SaunumInvalidDataError,
+        match="Incomplete control and status register data: expected 105, got 7",
+    ):
+        await client.async_get_data()
+
+
+def test_plan_reads() -> None:
+    """Test read planning merges adjacent blocks and respects the size limit."""
+    blocks = (("b", 10, 5), ("a", 0, 10), ("c", 20, 5), ("d", 200, 6))
+
+    assert _plan_reads(blocks, merge_gaps=False) == [
+        (0, 15, [("a", 0, 10), ("b", 10, 5)]),
+        (20, 5, [("c", 20, 5)]),
+        (200, 6, [("d", 200, 6)]),
+    ]
+    assert _plan_reads(blocks, merge_gaps=True) == [
+        (0, 25, [("a", 0, 10), ("b", 10, 5), ("c", 20, 5)]),
+        (200, 6, [("d", 200, 6)]),
+    ]
+
+
+async def test_write_register_without_retries(mock_modbus_client: MagicMock) -> None:
+    """Test a failed write is not retried when retries is 0."""
+    mock_modbus_client.connected = True
+    mock_modbus_client.write_register.side_effect = ModbusException("Write error")
+
+    client = SaunumClient(host="192.168.1.100", retries=0)
+
+    with pytest.raises(SaunumCommunicationError, match="Modbus error writing register"):
+        await client.async_start_session()
+
+    assert mock_modbus_client.write_register.await_count == 1
+
+
+async def test_get_data_invalid_data(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when invalid data is received."""
     mock_modbus_client.connected = True
 
     # Mock holding registers response with insufficient data
-    holding_response = MagicMock()
-    holding_response.isError.return_value = False
-    holding_response.registers = [1]  # Not enough registers
+    holding_response = _response([1])  # Not enough registers
 
     mock_modbus_client.read_holding_registers.return_value = holding_response
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(
         SaunumInvalidDataError, match="Incomplete control register data"
     ):
         await client.async_get_data()
 
 
+async def test_get_data_missing_registers(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test get_data when a response carries no registers."""
+    mock_modbus_client.connected = True
+
+    mock_modbus_client.read_holding_registers.return_value = SimpleNamespace(
+        isError=_no_error
+    )
+
+    with pytest.raises(
+        SaunumInvalidDataError,
+        match="Incomplete control register data: expected 7, got 0",
+    ):
+        await client.async_get_data()
+
+
 async def test_get_data_high_target_temperature(
-    mock_modbus_client: MagicMock, caplog: pytest.LogCaptureFixture
+    mock_modbus_client: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+    client: SaunumClient,
 ) -> None:
     """Test get_data with target temperature above maximum."""
     mock_modbus_client.connected = True
 
     # Mock control registers response with high temperature
-    control_response = MagicMock()
-    control_response.isError.return_value = False
     # Target temp = 150°C (above max)
-    control_response.registers = [1, 0, 60, 10, 150, 2, 1]
+    control_response = _response([1, 0, 60, 10, 150, 2, 1])
 
     # Mock status registers response
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [75, 1800, 900, 1, 0]
+    status_response = _response([75, 1800, 900, 1, 0])
 
     # Mock alarm registers response
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -430,7 +715,6 @@ async def test_get_data_high_target_temperature(
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
     data = await client.async_get_data()
 
     # Should log warning and still set the temperature
@@ -438,25 +722,21 @@ async def test_get_data_high_target_temperature(
     assert data.target_temperature == 150
 
 
-async def test_get_data_low_target_temperature(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_low_target_temperature(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data with target temperature below minimum."""
     mock_modbus_client.connected = True
 
     # Mock control registers response with low temperature
-    control_response = MagicMock()
-    control_response.isError.return_value = False
     # Target temp = 30°C (below min)
-    control_response.registers = [1, 0, 60, 10, 30, 2, 1]
+    control_response = _response([1, 0, 60, 10, 30, 2, 1])
 
     # Mock status registers response
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [75, 1800, 900, 1, 0]
+    status_response = _response([75, 1800, 900, 1, 0])
 
     # Mock alarm registers response
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -464,14 +744,15 @@ async def test_get_data_low_target_temperature(mock_modbus_client: MagicMock) ->
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
     data = await client.async_get_data()
 
     # Raw value is passed through even if below the valid 40-100 range
     assert data.target_temperature == 30
 
 
-async def test_write_register_error(mock_modbus_client: MagicMock) -> None:
+async def test_write_register_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test write register with error response."""
     mock_modbus_client.connected = True
 
@@ -479,83 +760,214 @@ async def test_write_register_error(mock_modbus_client: MagicMock) -> None:
     write_response.isError.return_value = True
     mock_modbus_client.write_register.return_value = write_response
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumCommunicationError, match="Failed to write register"):
         await client.async_start_session()
 
 
-async def test_write_register_modbus_exception(mock_modbus_client: MagicMock) -> None:
+async def test_write_register_modbus_exception(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test write register with modbus exception."""
     mock_modbus_client.connected = True
     mock_modbus_client.write_register.side_effect = ModbusException("Write error")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumCommunicationError, match="Modbus error writing register"):
         await client.async_start_session()
 
+    assert mock_modbus_client.write_register.await_count == 3
 
-async def test_write_register_not_connected(mock_modbus_client: MagicMock) -> None:
-    """Test write register when not connected."""
-    mock_modbus_client.connected = False
 
-    client = SaunumClient(host="192.168.1.100")
+async def test_write_register_not_connected(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test write register when not connected."""
+    mock_modbus_client.write_register.side_effect = ConnectionException("Not connected")
 
     with pytest.raises(SaunumConnectionError, match="Not connected"):
         await client.async_start_session()
 
 
-async def test_write_register_timeout(mock_modbus_client: MagicMock) -> None:
+async def test_write_register_timeout(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test write register when timeout occurs."""
     mock_modbus_client.connected = True
     mock_modbus_client.write_register.side_effect = TimeoutError("Timeout")
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(SaunumTimeoutError, match="Timeout writing register"):
         await client.async_start_session()
 
 
-async def test_set_sauna_duration_valid(mock_modbus_client: MagicMock) -> None:
-    """Test setting valid sauna duration."""
+async def test_write_registers_batches_adjacent(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test adjacent registers are written in one request."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-    await client.async_set_sauna_duration(120)
+    await client._async_write_registers({4: 80, 2: 60, 3: 10, 6: 1})
 
+    mock_modbus_client.write_registers.assert_called_once_with(
+        address=2, values=[60, 10, 80], device_id=1
+    )
     mock_modbus_client.write_register.assert_called_once_with(
-        address=2, value=120, device_id=1
+        address=6, value=1, device_id=1
     )
 
 
-async def test_set_sauna_duration_invalid(mock_modbus_client: MagicMock) -> None:
-    """Test setting invalid sauna duration."""
+async def test_write_registers_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test batched write with error response."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
+    write_response = MagicMock()
+    write_response.isError.return_value = True
+    mock_modbus_client.write_registers.return_value = write_response
 
-    with pytest.raises(ValueError, match="Duration 800 minutes out of range"):
-        await client.async_set_sauna_duration(800)
+    with pytest.raises(SaunumCommunicationError, match="Failed to write registers 2-3"):
+        await client._async_write_registers({2: 60, 3: 10})
 
 
-async def test_set_sauna_duration_invalid_negative(
-    mock_modbus_client: MagicMock,
+async def test_apply_settings_single_write(
+    mock_modbus_client: MagicMock, client: SaunumClient
 ) -> None:
-    """Test setting invalid negative sauna duration."""
+    """Test applying every setting sends one batched write."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
+    await client.async_apply_settings(
+        session_active=False,
+        sauna_type=SaunaType.TYPE_2,
+        sauna_duration=120,
+        fan_duration=15,
+        target_temperature=85,
+        fan_speed=FanSpeed.MEDIUM,
+        light_on=False,
+    )
 
-    with pytest.raises(ValueError, match="Duration -5 minutes out of range"):
-        await client.async_set_sauna_duration(-5)
+    mock_modbus_client.write_registers.assert_called_once_with(
+        address=0, values=[0, 1, 120, 15, 85, 2, 0], device_id=1
+    )
+    mock_modbus_client.write_register.assert_not_called()
 
 
-async def test_set_sauna_duration_min_valid(mock_modbus_client: MagicMock) -> None:
-    """Test setting minimum valid sauna duration (1 minute)."""
+async def test_apply_settings_starts_session_last(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test starting the session is written after the other settings."""
+    mock_modbus_client.connected = True
+
+    await client.async_apply_settings(
+        session_active=True,
+        sauna_type=SaunaType.TYPE_2,
+        sauna_duration=120,
+        fan_duration=15,
+        target_temperature=85,
+        fan_speed=FanSpeed.MEDIUM,
+        light_on=False,
+    )
+
+    writes = [
+        entry
+        for entry in mock_modbus_client.mock_calls
+        if entry[0] in ("write_register", "write_registers")
+    ]
+    assert writes == [
+        call.write_registers(address=1, values=[1, 120, 15, 85, 2, 0], device_id=1),
+        call.write_register(address=0, value=1, device_id=1),
+    ]
+
+
+async def test_apply_settings_start_session_only(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test starting the session alone sends a single write."""
+    mock_modbus_client.connected = True
+
+    await client.async_apply_settings(session_active=True)
+
+    mock_modbus_client.write_register.assert_called_once_with(
+        address=0, value=1, device_id=1
+    )
+    mock_modbus_client.write_registers.assert_not_called()
+
+
+async def test_apply_settings_partial(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test only the given settings are written."""
+    mock_modbus_client.connected = True
+
+    await client.async_apply_settings(target_temperature=0, light_on=True)
+
+    assert mock_modbus_client.write_register.call_count == 2
+    mock_modbus_client.write_register.assert_any_call(address=4, value=0, device_id=1)
+    mock_modbus_client.write_register.assert_any_call(address=6, value=1, device_id=1)
+    mock_modbus_client.write_registers.assert_not_called()
+
+
+async def test_apply_settings_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test an invalid setting is rejected before anything is written."""
+    mock_modbus_client.connected = True
+
+    with pytest.raises(ValueError, match="Fan speed 4 out of range"):
+        await client.async_apply_settings(session_active=True, fan_speed=4)
+
+    mock_modbus_client.write_register.assert_not_called()
+    mock_modbus_client.write_registers.assert_not_called()
+
+
+async def test_apply_settings_empty(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test applying no settings does not contact the controller."""
+    await client.async_apply_settings()
+
+    mock_modbus_client.write_register.assert_not_called()
+    mock_modbus_client.write_registers.assert_not_called()
+
+
+async def test_set_sauna_duration_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test setting valid sauna duration."""
+    mock_modbus_client.connected = True
+
+    await client.async_set_sauna_duration(120)
+
+    mock_modbus_client.write_register.assert_called_once_with(
+        address=2, value=120, device_id=1
+    )
+
+
+async def test_set_sauna_duration_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test setting invalid sauna duration."""
+    mock_modbus_client.connected = True
+
+    with pytest.raises(ValueError, match="Duration 800 minutes out of range"):
+        await client.async_set_sauna_duration(800)
+
+
+async def test_set_sauna_duration_invalid_negative(
+    mock_modbus_client: MagicMock,
+    client: SaunumClient,
+) -> None:
+    """Test setting invalid negative sauna duration."""
+    mock_modbus_client.connected = True
+
+    with pytest.raises(ValueError, match="Duration -5 minutes out of range"):
+        await client.async_set_sauna_duration(-5)
+
+
+async def test_set_sauna_duration_min_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test setting minimum valid sauna duration (1 minute)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_duration(1)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -563,11 +975,12 @@ async def test_set_sauna_duration_min_valid(mock_modbus_client: MagicMock) -> No
     )
 
 
-async def test_set_sauna_duration_max_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_duration_max_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting maximum valid sauna duration (720 minutes / 12 hours)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_duration(720)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -575,11 +988,12 @@ async def test_set_sauna_duration_max_valid(mock_modbus_client: MagicMock) -> No
     )
 
 
-async def test_set_fan_speed_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_speed_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting valid fan speed."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_fan_speed(2)  # Medium speed
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -587,21 +1001,22 @@ async def test_set_fan_speed_valid(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_fan_speed_invalid(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_speed_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting invalid fan speed."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Fan speed 4 out of range \\(0-3\\)"):
         await client.async_set_fan_speed(4)
 
 
-async def test_set_sauna_type_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_type_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting valid sauna type 1 (value 0)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_type(0)  # Type 1 = value 0
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -609,21 +1024,22 @@ async def test_set_sauna_type_valid(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_sauna_type_invalid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_type_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting invalid sauna type."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Sauna type 3 invalid"):
         await client.async_set_sauna_type(3)
 
 
-async def test_set_sauna_type_2_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_type_2_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting sauna type 2 (value 1)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_type(1)  # Type 2 = value 1
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -631,11 +1047,12 @@ async def test_set_sauna_type_2_valid(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_sauna_type_3_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_type_3_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting sauna type 3 (value 2)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_type(2)  # Type 3 = value 2
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -643,11 +1060,12 @@ async def test_set_sauna_type_3_valid(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_light_control(mock_modbus_client: MagicMock) -> None:
+async def test_set_light_control(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting light control."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_light_control(True)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -655,11 +1073,104 @@ async def test_set_light_control(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_fan_duration_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_light_control_without_ack(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test a background light write finishes before the client closes."""
+    mock_modbus_client.connected = True
+    written = asyncio.Event()
+
+    async def write(**_: Any) -> SimpleNamespace:
+        await written.wait()
+        return _response()
+
+    mock_modbus_client.write_register.side_effect = write
+
+    await client.async_set_light_control(True, await_ack=False)
+    await asyncio.sleep(0)
+
+    mock_modbus_client.write_register.assert_called_once_with(
+        address=6, value=1, device_id=1
+    )
+    close = asyncio.create_task(client.async_close())
+    await asyncio.sleep(0)
+    mock_modbus_client.close.assert_not_called()
+
+    written.set()
+    await close
+    mock_modbus_client.close.assert_called_once()
+
+
+async def test_set_light_control_without_ack_error(
+    mock_modbus_client: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+    client: SaunumClient,
+) -> None:
+    """Test a failed background light write is logged, not raised."""
+    mock_modbus_client.connected = True
+    mock_modbus_client.write_register.side_effect = TimeoutError()
+
+    await client.async_set_light_control(False, await_ack=False)
+    await client.async_close()
+
+    assert "Background write failed: Timeout writing register 6" in caplog.text
+
+
+async def test_set_light_control_without_ack_in_order(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test a retried background light write cannot overtake a later one."""
+    mock_modbus_client.connected = True
+
+    def written() -> list[int]:
+        return [
+            entry.kwargs["value"]
+            for entry in mock_modbus_client.write_register.call_args_list
+        ]
+
+    mock_modbus_client.write_register.side_effect = [
+        ModbusException("busy"),
+        _response(),
+        _response(),
+    ]
+    await client.async_set_light_control(True, await_ack=False)
+    await client.async_set_light_control(False, await_ack=False)
+    await client.async_close()
+    assert written() == [1, 1, 0]
+
+    # A write that waits for the acknowledgement queues behind them too
+    mock_modbus_client.write_register.reset_mock(side_effect=True)
+    mock_modbus_client.write_register.side_effect = [
+        ModbusException("busy"),
+        _response(),
+        _response(),
+    ]
+    await client.async_set_light_control(True, await_ack=False)
+    await client.async_set_light_control(False)
+    assert written() == [1, 1, 0]
+
+
+async def test_set_light_control_without_ack_cancelled(
+    mock_modbus_client: MagicMock,
+    client: SaunumClient,
+) -> None:
+    """Test a cancelled background light write is released quietly."""
+    mock_modbus_client.connected = True
+
+    await client.async_set_light_control(True, await_ack=False)
+    for task in client._pending_writes:
+        task.cancel()
+    await client.async_close()
+
+    assert not client._pending_writes
+
+
+async def test_set_fan_duration_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting valid fan duration."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_fan_duration(15)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -667,11 +1178,12 @@ async def test_set_fan_duration_valid(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_fan_duration_zero(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_duration_zero(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting fan duration to zero (off)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_fan_duration(0)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -679,11 +1191,12 @@ async def test_set_fan_duration_zero(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_fan_duration_max(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_duration_max(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting fan duration to maximum (30)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_fan_duration(30)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -691,31 +1204,32 @@ async def test_set_fan_duration_max(mock_modbus_client: MagicMock) -> None:
     )
 
 
-async def test_set_fan_duration_invalid_high(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_duration_invalid_high(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting invalid high fan duration."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Fan duration 31 minutes out of range"):
         await client.async_set_fan_duration(31)
 
 
-async def test_set_fan_duration_invalid_negative(mock_modbus_client: MagicMock) -> None:
+async def test_set_fan_duration_invalid_negative(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting invalid negative fan duration."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Fan duration -1 minutes out of range"):
         await client.async_set_fan_duration(-1)
 
 
-async def test_set_temperature_zero_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_temperature_zero_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting temperature to zero (off)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_target_temperature(0)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -723,31 +1237,32 @@ async def test_set_temperature_zero_valid(mock_modbus_client: MagicMock) -> None
     )
 
 
-async def test_set_temperature_below_min_invalid(mock_modbus_client: MagicMock) -> None:
+async def test_set_temperature_below_min_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting temperature below minimum (but not zero)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Temperature 39°C out of range"):
         await client.async_set_target_temperature(39)
 
 
-async def test_set_temperature_negative_invalid(mock_modbus_client: MagicMock) -> None:
+async def test_set_temperature_negative_invalid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting negative temperature."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
-
     with pytest.raises(ValueError, match="Temperature -1°C out of range"):
         await client.async_set_target_temperature(-1)
 
 
-async def test_set_sauna_duration_zero_valid(mock_modbus_client: MagicMock) -> None:
+async def test_set_sauna_duration_zero_valid(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test setting sauna duration to zero (off)."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_set_sauna_duration(0)
 
     mock_modbus_client.write_register.assert_called_once_with(
@@ -755,28 +1270,22 @@ async def test_set_sauna_duration_zero_valid(mock_modbus_client: MagicMock) -> N
     )
 
 
-async def test_get_data_heater_elements_count(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_heater_elements_count(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test heater elements count parsing for different values."""
     mock_modbus_client.connected = True
 
     # Mock control registers response
-    control_response = MagicMock()
-    control_response.isError.return_value = False
-    control_response.registers = [0, 1, 0, 0, 0, 0, 0]  # minimal control data
+    control_response = _response([0, 1, 0, 0, 0, 0, 0])  # minimal control data
 
     # Mock alarm registers response
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]  # all alarms off
-
-    client = SaunumClient(host="192.168.1.100")
+    alarm_response = _response([0, 0, 0, 0, 0, 0])  # all alarms off
 
     # Test different heater element counts
     for count in [0, 1, 2, 3]:
-        status_response = MagicMock()
-        status_response.isError.return_value = False
         # temp=70, on_time_high=0, on_time_low=0, heater_elements=count, door=0
-        status_response.registers = [70, 0, 0, count, 0]
+        status_response = _response([70, 0, 0, count, 0])
 
         mock_modbus_client.read_holding_registers.side_effect = [
             control_response,
@@ -788,9 +1297,7 @@ async def test_get_data_heater_elements_count(mock_modbus_client: MagicMock) ->
         assert data.heater_elements_active == count
 
     # Test heater element count outside typical range - raw value passed through
-    status_response_other = MagicMock()
-    status_response_other.isError.return_value = False
-    status_response_other.registers = [70, 0, 0, 5, 0]
+    status_response_other = _response([70, 0, 0, 5, 0])
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -802,37 +1309,32 @@ async def test_get_data_heater_elements_count(mock_modbus_client: MagicMock) ->
     assert data.heater_elements_active == 5
 
 
-async def test_async_close_calls_close(mock_modbus_client: MagicMock) -> None:
+async def test_async_close_calls_close(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Ensure async_close calls underlying close."""
     mock_modbus_client.connected = True
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_close()
 
     mock_modbus_client.close.assert_called_once()
 
 
-async def test_get_data_fan_speed_validation(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_fan_speed_validation(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test fan speed validation for different values."""
     mock_modbus_client.connected = True
 
     # Mock status and alarm registers response
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [70, 0, 0, 1, 0]  # standard status data
+    status_response = _response([70, 0, 0, 1, 0])  # standard status data
 
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]  # all alarms off
-
-    client = SaunumClient(host="192.168.1.100")
+    alarm_response = _response([0, 0, 0, 0, 0, 0])  # all alarms off
 
     # Test valid fan speeds (0-3)
     for speed in [0, 1, 2, 3]:
-        control_response = MagicMock()
-        control_response.isError.return_value = False
         # session=1, type=1, duration=0, fan_dur=0, temp=0, fan_speed=speed, light=0
-        control_response.registers = [1, 1, 0, 0, 0, speed, 0]
+        control_response = _response([1, 1, 0, 0, 0, speed, 0])
 
         mock_modbus_client.read_holding_registers.side_effect = [
             control_response,
@@ -844,9 +1346,7 @@ async def test_get_data_fan_speed_validation(mock_modbus_client: MagicMock) -> N
         assert data.fan_speed == speed
 
     # Test invalid fan speed (>3) - should return None
-    control_response_invalid = MagicMock()
-    control_response_invalid.isError.return_value = False
-    control_response_invalid.registers = [1, 1, 0, 0, 0, 5, 0]  # invalid speed
+    control_response_invalid = _response([1, 1, 0, 0, 0, 5, 0])  # invalid speed
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response_invalid,
@@ -858,9 +1358,7 @@ async def test_get_data_fan_speed_validation(mock_modbus_client: MagicMock) -> N
     assert data.fan_speed is None
 
     # Test negative fan speed - should return None
-    control_response_negative = MagicMock()
-    control_response_negative.isError.return_value = False
-    control_response_negative.registers = [1, 1, 0, 0, 0, -1, 0]  # negative speed
+    control_response_negative = _response([1, 1, 0, 0, 0, -1, 0])  # negative speed
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response_negative,
@@ -872,22 +1370,18 @@ async def test_get_data_fan_speed_validation(mock_modbus_client: MagicMock) -> N
     assert data.fan_speed is None
 
 
-async def test_get_data_invalid_data_error(mock_modbus_client: MagicMock) -> None:
+async def test_get_data_invalid_data_error(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test get_data when invalid data structure causes parsing error."""
     mock_modbus_client.connected = True
 
     # Mock valid response structure but cause ValueError in SaunumData creation
-    control_response = MagicMock()
-    control_response.isError.return_value = False
-    control_response.registers = [1, 1, 60, 0, 80, 3, 1]
+    control_response = _response([1, 1, 60, 0, 80, 3, 1])
 
-    status_response = MagicMock()
-    status_response.isError.return_value = False
-    status_response.registers = [75, 0, 100, 3, 0]
+    status_response = _response([75, 0, 100, 3, 0])
 
-    alarm_response = MagicMock()
-    alarm_response.isError.return_value = False
-    alarm_response.registers = [0, 0, 0, 0, 0, 0]
+    alarm_response = _response([0, 0, 0, 0, 0, 0])
 
     mock_modbus_client.read_holding_registers.side_effect = [
         control_response,
@@ -895,20 +1389,19 @@ async def test_get_data_invalid_data_error(mock_modbus_client: MagicMock) -> Non
         alarm_response,
     ]
 
-    client = SaunumClient(host="192.168.1.100")
-
     # Mock SaunumData to raise a ValueError
-    with patch("pysaunum.client.SaunumData") as mock_data:
+    with patch.object(pysaunum_client, "SaunumData") as mock_data:
         mock_data.side_effect = ValueError("Test error")
         with pytest.raises(SaunumInvalidDataError, match="Invalid data received"):
             await client.async_get_data()
 
 
-async def test_async_close_when_not_connected(mock_modbus_client: MagicMock) -> None:
+async def test_async_close_when_not_connected(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
     """Test async_close when client is not connected."""
     mock_modbus_client.connected = False
 
-    client = SaunumClient(host="192.168.1.100")
     await client.async_close()
 
     # close should not be called when not connected
@@ -917,8 +1410,6 @@ async def test_async_close_when_not_connected(mock_modbus_client: MagicMock) ->
 
 async def test_create_factory_method_success(mock_modbus_client: MagicMock) -> None:
     """Test factory method creates and connects client."""
-    mock_modbus_client.connected = True
-
     client = await SaunumClient.create("192.168.1.100")
 
     assert client.host == "192.168.1.100"
@@ -930,7 +1421,7 @@ async def test_create_factory_method_connection_failure(
     mock_modbus_client: MagicMock,
 ) -> None:
     """Test factory method raises error on connection failure."""
-    mock_modbus_client.connected = False
+    mock_modbus_client.connect.side_effect = None
 
     with pytest.raises(SaunumConnectionError, match="Failed to connect"):
         await SaunumClient.create("192.168.1.100")
@@ -940,8 +1431,6 @@ async def test_create_factory_method_with_custom_params(
     mock_modbus_client: MagicMock,
 ) -> None:
     """Test factory method with custom parameters."""
-    mock_modbus_client.connected = True
-
     client = await SaunumClient.create(
         host="192.168.1.50",
         port=5020,
@@ -968,3 +1457,521 @@ async def test_create_factory_method_modbus_exception(
 
     with pytest.raises(SaunumConnectionError, match="Failed to connect"):
         await SaunumClient.create("192.168.1.100")
+
+
+async def test_get_data_cached_within_ttl(mock_modbus_client: MagicMock) -> None:
+    """Test data is served from cache within the TTL."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    first = await client.async_get_data()
+    second = await client.async_get_data()
+
+    assert second is first
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_get_data_debug_logging(
+    mock_modbus_client: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reads are logged when debug logging is enabled."""
+    caplog.set_level(logging.DEBUG, logger="pysaunum")
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    await client.async_get_data()
+    await client.async_get_data()
+
+    assert "Fetching data from 192.168.1.100:502" in caplog.text
+    assert "Data fetched: session=True, temp=75.0°C" in caplog.text
+    assert "Returning cached data for 192.168.1.100:502" in caplog.text
+
+
+async def test_get_data_cache_expires(mock_modbus_client: MagicMock) -> None:
+    """Test data is read again once the TTL has passed."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=0.01)
+    await client.async_get_data()
+    await asyncio.sleep(0.02)
+    await client.async_get_data()
+
+    assert mock_modbus_client.read_holding_registers.await_count == 6
+
+
+async def test_get_data_force_refresh(mock_modbus_client: MagicMock) -> None:
+    """Test force_refresh bypasses the cache."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    first = await client.async_get_data()
+    second = await client.async_get_data(force_refresh=True)
+
+    assert second is not first
+    assert mock_modbus_client.read_holding_registers.await_count == 6
+
+
+async def test_get_data_concurrent_calls_share_read(
+    mock_modbus_client: MagicMock,
+    client: SaunumClient,
+) -> None:
+    """Test concurrent callers share one in-flight read."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    first, second = await asyncio.gather(
+        client.async_get_data(), client.async_get_data()
+    )
+
+    assert second is first
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_get_data_cancelled_caller_keeps_shared_read(
+    mock_modbus_client: MagicMock,
+    client: SaunumClient,
+) -> None:
+    """Test cancelling one caller does not cancel the shared read."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    cancelled = asyncio.create_task(client.async_get_data())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(client.async_get_data())
+    cancelled.cancel()
+
+    data = await waiting
+
+    assert cancelled.cancelled()
+    assert data.session_active is True
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_write_invalidates_cached_data(mock_modbus_client: MagicMock) -> None:
+    """Test a write drops cached data and any in-flight read."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    await client.async_get_data()
+    stale = asyncio.create_task(client.async_get_data(force_refresh=True))
+    await asyncio.sleep(0)
+    await client.async_start_session()
+    await stale
+    await client.async_get_data()
+
+    assert mock_modbus_client.read_holding_registers.await_count == 9
+
+
+async def test_close_invalidates_cached_data(mock_modbus_client: MagicMock) -> None:
+    """Test closing the connection drops cached data."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    await client.async_get_data()
+    await client.async_close()
+    await client.async_get_data()
+
+    assert mock_modbus_client.read_holding_registers.await_count == 6
+
+
+def _control_reads(mock_modbus_client: MagicMock) -> int:
+    """Count reads that included the control registers."""
+    return sum(
+        call.kwargs["address"] == REG_SESSION_ACTIVE
+        for call in mock_modbus_client.read_holding_registers.await_args_list
+    )
+
+
+async def test_control_cache(mock_modbus_client: MagicMock) -> None:
+    """Test control registers are reused until a write or the TTL expires."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", control_cache_ttl=0.05)
+    first = await client.async_get_data()
+    second = await client.async_get_data()
+
+    assert second == first
+    assert mock_modbus_client.read_holding_registers.await_count == 5
+    assert _control_reads(mock_modbus_client) == 1
+
+    await client.async_set_fan_speed(FanSpeed.HIGH)
+    await client.async_get_data()
+    assert _control_reads(mock_modbus_client) == 2
+
+    await asyncio.sleep(0.06)
+    await client.async_get_data()
+    assert _control_reads(mock_modbus_client) == 3
+
+
+async def test_control_cache_write_during_read(mock_modbus_client: MagicMock) -> None:
+    """Test control registers read before a write are not cached."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", control_cache_ttl=60)
+    stale = asyncio.create_task(client.async_get_data())
+    await asyncio.sleep(0)
+    await client.async_start_session()
+    await stale
+    await client.async_get_data()
+
+    assert _control_reads(mock_modbus_client) == 2
+
+
+async def test_skip_unchanged_writes(mock_modbus_client: MagicMock) -> None:
+    """Test writes of values the controller already holds are skipped."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", skip_unchanged_writes=True)
+    await client.async_get_data()
+
+    # Read values: duration 60 minutes, target 80°C, fan Medium
+    await client.async_set_target_temperature(80)
+    await client.async_apply_settings(fan_speed=FanSpeed.MEDIUM, sauna_duration=30)
+    mock_modbus_client.write_register.assert_called_once_with(
+        address=2, value=30, device_id=1
+    )
+
+    # Values written by the client are remembered too
+    await client.async_set_sauna_duration(30)
+    assert mock_modbus_client.write_register.call_count == 1
+
+
+async def test_skip_unchanged_writes_session_and_light(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test session and light commands are always written."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", skip_unchanged_writes=True)
+    await client.async_get_data()
+
+    # The session may have ended on its own since the first start
+    await client.async_start_session()
+    await client.async_start_session()
+    await client.async_set_light_control(True)
+    await client.async_set_light_control(True)
+
+    assert mock_modbus_client.write_register.call_count == 4
+
+
+async def test_skip_unchanged_writes_after_failure(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test a failed write is retried instead of skipped."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", retries=0, skip_unchanged_writes=True)
+    await client.async_get_data()
+    mock_modbus_client.write_register.side_effect = ModbusException("Busy")
+
+    with pytest.raises(SaunumCommunicationError):
+        await client.async_set_target_temperature(90)
+
+    mock_modbus_client.write_register.side_effect = None
+    await client.async_set_target_temperature(80)
+
+    assert mock_modbus_client.write_register.call_count == 2
+
+
+async def test_skip_unchanged_writes_forgets_on_close(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test known values are dropped when the connection closes."""
+    mock_modbus_client.connected = True
+
+    client = SaunumClient(host="192.168.1.100", skip_unchanged_writes=True)
+    await client.async_set_fan_speed(FanSpeed.LOW)
+    await client.async_close()
+    mock_modbus_client.connected = True
+    await client.async_set_fan_speed(FanSpeed.LOW)
+
+    assert mock_modbus_client.write_register.call_count == 2
+
+
+async def test_create_primes_cache(mock_modbus_client: MagicMock) -> None:
+    """Test factory method reads data once when caching is enabled."""
+    _mock_registers(mock_modbus_client)
+
+    client = await SaunumClient.create("192.168.1.100", cache_ttl=60)
+    await client.async_get_data()
+
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_create_ignores_priming_failure(mock_modbus_client: MagicMock) -> None:
+    """Test factory method still returns a client if the initial read fails."""
+    mock_modbus_client.read_holding_registers.side_effect = ModbusException("Busy")
+
+    client = await SaunumClient.create("192.168.1.100", cache_ttl=60)
+
+    assert client.is_connected
+
+
+async def test_connect_warms_cache(mock_modbus_client: MagicMock) -> None:
+    """Test connect starts a background read that the first caller joins."""
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    await client.connect()
+    assert client._data_task is not None
+
+    data = await client.async_get_data()
+
+    assert data.session_active is True
+    assert mock_modbus_client.read_holding_registers.await_count == 3
+
+
+async def test_connect_warm_read_cancelled(mock_modbus_client: MagicMock) -> None:
+    """Test a cancelled warm-up read is released without caching."""
+
+    async def hang(**_: Any) -> None:
+        await asyncio.sleep(10)
+
+    mock_modbus_client.read_holding_registers.side_effect = hang
+
+    client = SaunumClient(host="192.168.1.100", cache_ttl=60)
+    await client.connect()
+    task = client._data_task
+    assert task is not None
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert client._data_task is None
+    assert client._cache_value is None
+
+
+async def test_stream_updates_yields_changes(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test stream yields the first reading and then only changes."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    first = await client.async_get_data()
+    changed = replace(first, current_temperature=76.0)
+    client.async_get_data = AsyncMock(  # type: ignore[method-assign]
+        side_effect=[
+            first,
+            replace(first),
+            SaunumCommunicationError("Busy"),
+            SaunumTimeoutError("Timeout"),
+            changed,
+        ]
+    )
+
+    stream = client.async_stream_updates(interval=0.001)
+    assert await anext(stream) is first
+    assert await anext(stream) is changed
+    await stream.aclose()
+
+    assert client.async_get_data.await_count == 5
+
+
+async def test_stream_updates_invalid_interval(
+    mock_modbus_client: MagicMock, client: SaunumClient
+) -> None:
+    """Test stream rejects a non-positive interval."""
+    mock_modbus_client.connected = True
+
+    with pytest.raises(ValueError, match="must be positive"):
+        await anext(client.async_stream_updates(interval=0))
+
+
+async def test_pooled_clients_share_connection(mock_modbus_client: MagicMock) -> None:
+    """Test pooled clients reuse one connection that async_close leaves open."""
+    first = await SaunumClient.create("192.168.1.100", pooled=True)
+    await first.async_close()
+    second = await SaunumClient.create("192.168.1.100", pooled=True)
+
+    try:
+        assert second.is_connected
+        assert mock_modbus_client.connect.await_count == 1
+        mock_modbus_client.close.assert_not_called()
+        assert SaunumClient._pool == {
+            (asyncio.get_running_loop(), "192.168.1.100", 502): mock_modbus_client
+        }
+    finally:
+        await SaunumClient.async_close_pool()
+
+    mock_modbus_client.close.assert_called_once()
+    assert not SaunumClient._pool
+
+
+async def test_pooled_client_rejoins_closed_pool(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test a pooled client reconnecting after the pool closed rejoins it."""
+    client = await SaunumClient.create("192.168.1.100", pooled=True)
+    await SaunumClient.async_close_pool()
+    mock_modbus_client.connected = False
+
+    key = (asyncio.get_running_loop(), "192.168.1.100", 502)
+
+    try:
+        await client.connect()
+        assert SaunumClient._pool == {key: mock_modbus_client}
+
+        # A connection pooled by another client in the meantime is used
+        other = MagicMock(connected=True)
+        other.read_holding_registers = AsyncMock(return_value=_response([0] * 7))
+        SaunumClient._pool[key] = other
+        await client.connect()
+        assert client.is_connected
+        await client.async_get_data()
+        assert other.read_holding_registers.await_count == 3
+    finally:
+        await SaunumClient.async_close_pool()
+
+    assert mock_modbus_client.close.call_count == 1
+    other.close.assert_called_once()
+
+
+def test_pooled_clients_per_event_loop(mock_modbus_client: MagicMock) -> None:
+    """Test each event loop gets its own pooled connection and lock."""
+
+    async def connect() -> bool:
+        # Yield so the second client waits on the shared connect lock
+        await asyncio.sleep(0)
+        mock_modbus_client.connected = True
+        return True
+
+    mock_modbus_client.connect.side_effect = connect
+
+    async def open_clients() -> list[object]:
+        clients = await asyncio.gather(
+            SaunumClient.create("192.168.1.100", pooled=True),
+            SaunumClient.create("192.168.1.100", pooled=True),
+        )
+        for client in clients:
+            await client.async_close()
+        return list(SaunumClient._pool)
+
+    first_keys = asyncio.run(open_clients())
+    # The connection died with the first loop
+    mock_modbus_client.connected = False
+    second_keys = asyncio.run(open_clients())
+
+    assert len(first_keys) == len(second_keys) == 1
+    assert first_keys != second_keys
+    assert mock_modbus_client.connect.await_count == 2
+
+    # Pooled connections of closed loops are forgotten
+    asyncio.run(SaunumClient.async_close_pool())
+    assert not SaunumClient._pool
+    assert not SaunumClient._pool_locks
+    mock_modbus_client.close.assert_not_called()
+
+
+async def test_close_pool_keeps_other_loops(mock_modbus_client: MagicMock) -> None:
+    """Test async_close_pool only closes connections of the running loop."""
+    other_loop = asyncio.new_event_loop()
+    other = MagicMock()
+    SaunumClient._pool[(other_loop, "192.168.1.100", 502)] = other
+
+    try:
+        client = await SaunumClient.create("192.168.1.100", pooled=True)
+        await client.async_close()
+        await SaunumClient.async_close_pool()
+
+        mock_modbus_client.close.assert_called_once()
+        other.close.assert_not_called()
+        assert list(SaunumClient._pool) == [(other_loop, "192.168.1.100", 502)]
+    finally:
+        other_loop.close()
+        SaunumClient._drop_closed_loops()
+
+    assert not SaunumClient._pool
+
+
+async def test_unpooled_client_not_added_to_pool(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test clients are only pooled when asked to."""
+    client = await SaunumClient.create("192.168.1.100")
+    await client.async_close()
+
+    assert not SaunumClient._pool
+    mock_modbus_client.close.assert_called_once()
+
+
+def _alarm_reads(mock_modbus_client: MagicMock) -> int:
+    """Return how many reads requested the alarm registers."""
+    return sum(
+        call.kwargs["address"] == REG_ALARM_DOOR_OPEN
+        for call in mock_modbus_client.read_holding_registers.await_args_list
+    )
+
+
+async def test_adaptive_alarm_polling(mock_modbus_client: MagicMock) -> None:
+    """Test quiet alarms are read less often until a write resets the gap."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+
+    client = SaunumClient(host="192.168.1.100", adaptive_alarm_polling=True)
+    for _ in range(7):
+        data = await client.async_get_data()
+        assert not data.alarm_flags
+
+    # Alarms are read on the 1st, 3rd and 7th poll
+    assert _alarm_reads(mock_modbus_client) == 3
+
+    await client.async_start_session()
+    await client.async_get_data()
+
+    assert _alarm_reads(mock_modbus_client) == 4
+
+
+async def test_adaptive_alarm_polling_read_during_write(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test a read detached by a write does not widen the alarm gap."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client)
+    read = mock_modbus_client.read_holding_registers.side_effect
+    release = asyncio.Event()
+
+    async def held_read(**kwargs: Any) -> SimpleNamespace:
+        await release.wait()
+        response: SimpleNamespace = read(**kwargs)
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = held_read
+
+    client = SaunumClient(host="192.168.1.100", adaptive_alarm_polling=True)
+    task = asyncio.create_task(client.async_get_data())
+    await asyncio.sleep(0)
+    await client.async_start_session()
+    release.set()
+    await task
+
+    # The write reset the gap, so the next read checks the alarms again
+    await client.async_get_data()
+    assert _alarm_reads(mock_modbus_client) == 2
+
+
+async def test_adaptive_alarm_polling_active_alarm(
+    mock_modbus_client: MagicMock,
+) -> None:
+    """Test alarms are read on every poll while one is active."""
+    mock_modbus_client.connected = True
+    _mock_registers(mock_modbus_client, alarm=[1, 0, 0, 0, 0, 0])
+
+    client = SaunumClient(host="192.168.1.100", adaptive_alarm_polling=True)
+    for _ in range(3):
+        data = await client.async_get_data()
+        assert data.alarm_door_open
+
+    assert _alarm_reads(mock_modbus_client) == 3
@@ -0,0 +1,18 @@
+"""Tests for the pysaunum package."""
+
+from importlib.metadata import version
+
+import pytest
+
+import pysaunum
+
+
+def test_version() -> None:
+    """Test __version__ matches the installed package metadata."""
+    assert pysaunum.__version__ == version("pysaunum")
+
+
+def test_unknown_attribute() -> None:
+    """Test unknown module attributes raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        getattr(pysaunum, "missing")  # noqa: B009
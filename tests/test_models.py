@@ -0,0 +1,57 @@
+"""Tests for data models."""
+
+from dataclasses import replace
+
+from pysaunum import AlarmFlag, SaunumData
+
+_DATA = SaunumData(
+    session_active=False,
+    sauna_type=0,
+    sauna_duration=0,
+    fan_duration=0,
+    target_temperature=0,
+    fan_speed=None,
+    light_on=False,
+    current_temperature=20.0,
+    on_time=0,
+    heater_elements_active=0,
+    door_open=False,
+    alarm_door_open=False,
+    alarm_door_sensor=False,
+    alarm_thermal_cutoff=False,
+    alarm_internal_temp=False,
+    alarm_temp_sensor_short=False,
+    alarm_temp_sensor_open=False,
+)
+
+
+def test_alarm_flags_none() -> None:
+    """Test alarm_flags is falsy when no alarm is active."""
+    assert _DATA.alarm_flags == AlarmFlag(0)
+    assert not _DATA.alarm_flags
+
+
+def test_alarm_flags() -> None:
+    """Test alarm_flags has one bit per active alarm."""
+    data = replace(
+        _DATA,
+        alarm_door_open=True,
+        alarm_door_sensor=True,
+        alarm_thermal_cutoff=True,
+        alarm_internal_temp=True,
+        alarm_temp_sensor_short=True,
+        alarm_temp_sensor_open=True,
+    )
+
+    assert data.alarm_flags == (
+        AlarmFlag.DOOR_OPEN
+        | AlarmFlag.DOOR_SENSOR
+        | AlarmFlag.THERMAL_CUTOFF
+        | AlarmFlag.INTERNAL_TEMP
+        | AlarmFlag.TEMP_SENSOR_SHORT
+        | AlarmFlag.TEMP_SENSOR_OPEN
+    )
+
+    data = replace(_DATA, alarm_thermal_cutoff=True)
+    assert data.alarm_flags == AlarmFlag.THERMAL_CUTOFF
+    assert not data.alarm_flags & AlarmFlag.DOOR_OPEN